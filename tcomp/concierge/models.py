@@ -1673,11 +1673,15 @@ class WhatsAppServiceWindow(models.Model):
             models.Index(fields=['phone', 'last_inbound_at']),
         ]
 
+    @staticmethod
+    def active_cutoff():
+        """Inbound messages after this instant keep a window open (24h minus 5-min margin)."""
+        return timezone.now() - timedelta(hours=23, minutes=55)
+
     @property
     def is_active(self):
         """True if the 24h window is still open (with 5-minute safety margin)."""
-        from datetime import timedelta
-        return self.last_inbound_at > timezone.now() - timedelta(hours=23, minutes=55)
+        return self.last_inbound_at > self.active_cutoff()
 
     def __str__(self):
         return f'WA window: {self.phone} @ {self.hotel.name}'
@@ -1,9 +1,12 @@
+import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Optional
 
 from concierge.models import Department, Hotel, ServiceRequest
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class NotificationEvent:
@@ -49,3 +52,21 @@ class ChannelAdapter(ABC):
     def send(self, recipient, event: NotificationEvent):
         """Send notification to a single recipient.
         Returns DeliveryRecord (WhatsApp/Email) or Notification (Push)."""
+
+    def send_many(self, recipients, event: NotificationEvent):
+        """Send notification to every recipient.
+
+        Default: one send() per recipient, isolating per-recipient failures.
+        Route-based adapters override this to batch their DeliveryRecord writes.
+        """
+        for recipient in recipients:
+            try:
+                self.send(recipient, event)
+            except Exception:
+                logger.exception(
+                    "%s.send() failed for recipient %s on %s",
+                    self.__class__.__name__,
+                    getattr(recipient, "target", recipient),
+                    event.event_type,
+                )
+                # Continue to next recipient — one bad recipient must not abort the rest
@@ -40,14 +40,12 @@ def dispatch_notification(event: NotificationEvent):
             )
             continue  # Never let one adapter failure block others
 
-        for recipient in recipients:
-            try:
-                adapter.send(recipient, event)
-            except Exception:
-                logger.exception(
-                    "%s.send() failed for recipient %s on %s",
-                    adapter.__class__.__name__,
-                    getattr(recipient, "target", recipient),
-                    event.event_type,
-                )
-                # Continue to next recipient — one bad recipient must not abort the rest
+        try:
+            # Per-recipient failures are isolated inside send_many()
+            adapter.send_many(recipients, event)
+        except Exception:
+            logger.exception(
+                "%s.send_many() failed for %s",
+                adapter.__class__.__name__,
+                event.event_type,
+            )
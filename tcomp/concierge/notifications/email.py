@@ -1,7 +1,7 @@
 import logging
 
 from django.conf import settings
-from django.db import connection
+from django.db import IntegrityError, connection, transaction
 from django.db.models import Q
 
 from concierge.models import DeliveryRecord, NotificationRoute
@@ -59,7 +59,7 @@ class EmailAdapter(ChannelAdapter):
             scope_q,
             channel=NotificationRoute.Channel.EMAIL,
             is_active=True,
-        ).order_by("target", "id")
+        ).only("id", "channel", "target").order_by("target", "id")
 
         # Dedupe by target (same pattern as WhatsApp)
         if connection.vendor == "postgresql":
@@ -75,23 +75,9 @@ class EmailAdapter(ChannelAdapter):
     def send(self, route, event):
         from .tasks import send_email_notification
 
-        idempotency_key = (
-            f"email:{event.event_type}:{event.request.public_id}"
-            f":{event.escalation_tier or 0}:{route.id}"
-        )
-
         record, created = DeliveryRecord.objects.get_or_create(
-            idempotency_key=idempotency_key,
-            defaults={
-                "hotel": event.hotel,
-                "route": route,
-                "request": event.request,
-                "channel": "EMAIL",
-                "target": route.target,
-                "event_type": event.event_type,
-                "status": DeliveryRecord.Status.QUEUED,
-                "message_type": "TEMPLATE",
-            },
+            idempotency_key=self._idempotency_key(route, event),
+            defaults=self._record_fields(route, event),
         )
         if not created:
             return record
@@ -100,6 +86,55 @@ class EmailAdapter(ChannelAdapter):
         send_email_notification.delay(record.id, params)
         return record
 
+    def send_many(self, routes, event):
+        """Batch send(): one existence check and one INSERT for all routes."""
+        from .tasks import send_email_notification
+
+        keys = [self._idempotency_key(route, event) for route in routes]
+        existing = set(
+            DeliveryRecord.objects.filter(idempotency_key__in=keys)
+            .values_list("idempotency_key", flat=True)
+        )
+        pending = [
+            DeliveryRecord(idempotency_key=key, **self._record_fields(route, event))
+            for route, key in zip(routes, keys)
+            if key not in existing
+        ]
+        if not pending:
+            return
+        try:
+            with transaction.atomic():
+                records = DeliveryRecord.objects.bulk_create(pending)
+        except IntegrityError:
+            # A concurrent dispatch claimed a key first — resolve per route
+            super().send_many(routes, event)
+            return
+
+        params = self._build_params(event)
+        for record in records:
+            try:
+                send_email_notification.delay(record.id, params)
+            except Exception:
+                logger.exception("Failed to enqueue email for %s on %s", record.target, event.event_type)
+
+    def _idempotency_key(self, route, event):
+        return (
+            f"email:{event.event_type}:{event.request.public_id}"
+            f":{event.escalation_tier or 0}:{route.id}"
+        )
+
+    def _record_fields(self, route, event):
+        return {
+            "hotel": event.hotel,
+            "route": route,
+            "request": event.request,
+            "channel": "EMAIL",
+            "target": route.target,
+            "event_type": event.event_type,
+            "status": DeliveryRecord.Status.QUEUED,
+            "message_type": "TEMPLATE",
+        }
+
     def _build_params(self, event):
         req = event.request
         dept_name = event.extra.get("original_department_name") or event.department.name
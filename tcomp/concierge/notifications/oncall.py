@@ -1,8 +1,10 @@
 import logging
 import re
 from dataclasses import dataclass
+from functools import partial
 
 from django.conf import settings
+from django.db import IntegrityError, transaction
 
 from concierge.models import DeliveryRecord, WhatsAppServiceWindow
 
@@ -91,69 +93,116 @@ class OncallAdapter(ChannelAdapter):
             send_whatsapp_template_notification,
         )
 
-        idempotency_key = (
-            f"oncall:wa:{event.request.public_id}"
-            f":{event.escalation_tier or 0}"
-        )
-
         window = WhatsAppServiceWindow.objects.filter(
             hotel=event.hotel, phone=oncall_target.target,
         ).first()
         use_session = window and window.is_active
 
         record, created = DeliveryRecord.objects.get_or_create(
-            idempotency_key=idempotency_key,
-            defaults={
-                "hotel": event.hotel,
-                "route": None,
-                "request": event.request,
-                "channel": "WHATSAPP",
-                "target": oncall_target.target,
-                "event_type": event.event_type,
-                "status": DeliveryRecord.Status.QUEUED,
-                "message_type": "SESSION" if use_session else "TEMPLATE",
-            },
+            idempotency_key=self._idempotency_key(oncall_target, event),
+            defaults=self._record_fields(oncall_target, event, use_session),
         )
         if not created:
             return record
 
         params = self._build_params(event)
-
-        if use_session:
-            send_whatsapp_session_notification.delay(record.id, params)
-        else:
-            send_whatsapp_template_notification.delay(record.id, params)
-
+        task = (
+            send_whatsapp_session_notification if use_session
+            else send_whatsapp_template_notification
+        )
+        # Publish after commit so the worker can always load the record;
+        # robust so a broker error is logged and never skips later callbacks
+        transaction.on_commit(partial(task.delay, record.id, params), robust=True)
         return record
 
     def _send_email(self, oncall_target, event):
         from .tasks import send_email_notification
 
-        idempotency_key = (
-            f"oncall:email:{event.request.public_id}"
-            f":{event.escalation_tier or 0}"
-        )
-
         record, created = DeliveryRecord.objects.get_or_create(
-            idempotency_key=idempotency_key,
-            defaults={
-                "hotel": event.hotel,
-                "route": None,
-                "request": event.request,
-                "channel": "EMAIL",
-                "target": oncall_target.target,
-                "event_type": event.event_type,
-                "status": DeliveryRecord.Status.QUEUED,
-                "message_type": "TEMPLATE",
-            },
+            idempotency_key=self._idempotency_key(oncall_target, event),
+            defaults=self._record_fields(oncall_target, event),
         )
         if not created:
             return record
 
         params = self._build_params(event)
-        send_email_notification.delay(record.id, params)
+        transaction.on_commit(
+            partial(send_email_notification.delay, record.id, params), robust=True,
+        )
         return record
 
+    def send_many(self, oncall_targets, event):
+        """Batch send(): one existence check, one window lookup and one INSERT."""
+        from .tasks import (
+            send_email_notification,
+            send_whatsapp_session_notification,
+            send_whatsapp_template_notification,
+        )
+
+        keys = [self._idempotency_key(t, event) for t in oncall_targets]
+        existing = set(
+            DeliveryRecord.objects.filter(idempotency_key__in=keys)
+            .values_list("idempotency_key", flat=True)
+        )
+        todo = [(t, key) for t, key in zip(oncall_targets, keys) if key not in existing]
+        if not todo:
+            return
+
+        phones = [t.target for t, _ in todo if t.channel == "WHATSAPP"]
+        active_phones = set()
+        if phones:
+            active_phones = set(
+                WhatsAppServiceWindow.objects.filter(
+                    hotel=event.hotel, phone__in=phones,
+                    last_inbound_at__gt=WhatsAppServiceWindow.active_cutoff(),
+                ).values_list("phone", flat=True)
+            )
+        pending = []
+        for oncall_target, key in todo:
+            use_session = (
+                oncall_target.channel == "WHATSAPP"
+                and oncall_target.target in active_phones
+            )
+            pending.append(DeliveryRecord(
+                idempotency_key=key,
+                **self._record_fields(oncall_target, event, use_session),
+            ))
+        try:
+            with transaction.atomic():
+                records = DeliveryRecord.objects.bulk_create(pending)
+        except IntegrityError:
+            # A concurrent dispatch claimed a key first — resolve per target
+            super().send_many(oncall_targets, event)
+            return
+
+        params = self._build_params(event)
+        for record in records:
+            if record.channel == "EMAIL":
+                task = send_email_notification
+            elif record.message_type == "SESSION":
+                task = send_whatsapp_session_notification
+            else:
+                task = send_whatsapp_template_notification
+            # robust: one failed publish is logged and never blocks the rest
+            transaction.on_commit(partial(task.delay, record.id, params), robust=True)
+
+    def _idempotency_key(self, oncall_target, event):
+        # One on-call delivery per (channel, request, escalation_tier)
+        prefix = "oncall:wa" if oncall_target.channel == "WHATSAPP" else "oncall:email"
+        return f"{prefix}:{event.request.public_id}:{event.escalation_tier or 0}"
+
+    def _record_fields(self, oncall_target, event, use_session=False):
+        return {
+            "hotel": event.hotel,
+            "route": None,
+            "request": event.request,
+            "channel": oncall_target.channel,
+            "target": oncall_target.target,
+            "event_type": event.event_type,
+            "status": DeliveryRecord.Status.QUEUED,
+            "message_type": "SESSION" if use_session else "TEMPLATE",
+        }
+
     def _build_params(self, event):
         req = event.request
         dept_name = event.extra.get("original_department_name") or event.department.name
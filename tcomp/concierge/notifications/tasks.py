@@ -1,7 +1,9 @@
 import json
 import logging
+from http.cookiejar import DefaultCookiePolicy
 
 import requests as http_requests
+from requests.adapters import HTTPAdapter
 from celery import shared_task
 from django.conf import settings
 
@@ -19,6 +21,24 @@ _TRANSIENT_ERRORS = (
     RuntimeError,
 )
 
+
+def _gupshup_session():
+    """Keep-alive session shared by every Gupshup send in a worker process.
+
+    Pooled connections skip a TCP/TLS handshake per message. Retries stay with
+    Celery (max_retries=0), and cookies are refused so nothing a response sets
+    (e.g. load-balancer affinity) is replayed on later sends for other hotels.
+    """
+    session = http_requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=32, pool_maxsize=64, max_retries=0,
+    ))
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+_GUPSHUP_SESSION = _gupshup_session()
+
 logger = logging.getLogger(__name__)
 
 
@@ -158,7 +178,7 @@ def send_whatsapp_template_notification(self, delivery_record_id, params):
         ]
 
     try:
-        response = http_requests.post(
+        response = _GUPSHUP_SESSION.post(
             "https://api.gupshup.io/wa/api/v1/template/msg",
             headers={"apikey": settings.GUPSHUP_WA_API_KEY},
             data={
@@ -210,7 +230,7 @@ def send_whatsapp_session_notification(self, delivery_record_id, params):
     message = _build_session_message(record.event_type, params)
 
     try:
-        response = http_requests.post(
+        response = _GUPSHUP_SESSION.post(
             "https://api.gupshup.io/wa/api/v1/msg",
             headers={"apikey": settings.GUPSHUP_WA_API_KEY},
             data={
@@ -320,7 +340,7 @@ def send_guest_invite_whatsapp(self, delivery_id):
     ]
 
     try:
-        response = http_requests.post(
+        response = _GUPSHUP_SESSION.post(
             "https://api.gupshup.io/wa/api/v1/template/msg",
             headers={"apikey": settings.GUPSHUP_WA_API_KEY},
             data={
@@ -409,7 +429,7 @@ def send_request_status_whatsapp_task(self, delivery_id, context):
     ]
 
     try:
-        response = http_requests.post(
+        response = _GUPSHUP_SESSION.post(
             "https://api.gupshup.io/wa/api/v1/template/msg",
             headers={"apikey": settings.GUPSHUP_WA_API_KEY},
             data={
@@ -656,7 +676,7 @@ def send_rating_whatsapp_task(self, hotel_id, guest_id, prompt_ids, batch_key):
 
     now = timezone.now()
     try:
-        response = http_requests.post(
+        response = _GUPSHUP_SESSION.post(
             "https://api.gupshup.io/wa/api/v1/template/msg",
             headers={"apikey": settings.GUPSHUP_WA_API_KEY},
             data={
@@ -769,7 +789,7 @@ def send_stay_survey_whatsapp_task(self, hotel_id, guest_id, prompt_id):
 
     now = timezone.now()
     try:
-        response = http_requests.post(
+        response = _GUPSHUP_SESSION.post(
             "https://api.gupshup.io/wa/api/v1/template/msg",
             headers={"apikey": settings.GUPSHUP_WA_API_KEY},
             data={
@@ -912,7 +932,7 @@ def send_low_score_whatsapp_task(self, hotel_id, rating_id):
             "text": text,
         }
         try:
-            response = http_requests.post(
+            response = _GUPSHUP_SESSION.post(
                 "https://api.gupshup.io/wa/api/v1/msg",
                 headers={"apikey": settings.GUPSHUP_WA_API_KEY},
                 data={
@@ -976,7 +996,7 @@ def send_low_score_whatsapp_task(self, hotel_id, rating_id):
     template_params = resolve_template_params(wa_template, context)
 
     try:
-        response = http_requests.post(
+        response = _GUPSHUP_SESSION.post(
             "https://api.gupshup.io/wa/api/v1/template/msg",
             headers={"apikey": settings.GUPSHUP_WA_API_KEY},
             data={
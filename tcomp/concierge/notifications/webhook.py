@@ -11,6 +11,7 @@ import requests as http_requests
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import transaction
+from django.db.models import Exists, OuterRef
 from django.utils import timezone
 
 from concierge.models import (
@@ -25,6 +26,9 @@ from shortlinks.models import ShortLink
 
 logger = logging.getLogger(__name__)
 
+# Compiled once — every inbound message normalizes its source phone.
+_NON_DIGITS_RE = re.compile(r"\D")
+
 
 def _resolve_postback(msg_payload):
     """Extract postback text from all known Gupshup inbound message formats.
@@ -33,22 +37,22 @@ def _resolve_postback(msg_payload):
     delivers template button taps inconsistently across API versions.
     The ``reply`` field may be a string or a dict like ``{"id": "ack:..."}``.
     """
-    msg_type = msg_payload.get("type", "")
-    if msg_type in ("quick_reply", "button_reply", "button"):
-        # postbackText may be at this level or nested inside an inner "payload" dict
-        postback = msg_payload.get("postbackText", "")
-        if not postback:
-            inner = msg_payload.get("payload", {})
-            if isinstance(inner, dict):
-                postback = inner.get("postbackText", "")
-        if postback and isinstance(postback, str):
-            return postback
-        reply = msg_payload.get("reply", "")
-        if isinstance(reply, dict):
-            # Gupshup sometimes wraps the postback in {"id": "...", "title": "..."}
-            return str(reply.get("id", "") or reply.get("title", ""))
-        if isinstance(reply, str):
-            return reply
+    match msg_payload:
+        case {"type": "quick_reply" | "button_reply" | "button"}:
+            # postbackText may be at this level or nested inside an inner "payload" dict
+            postback = msg_payload.get("postbackText", "")
+            if not postback:
+                match msg_payload.get("payload"):
+                    case {"postbackText": inner_postback}:
+                        postback = inner_postback
+            if postback and isinstance(postback, str):
+                return postback
+            match msg_payload.get("reply", ""):
+                case dict() as reply:
+                    # Gupshup sometimes wraps the postback in {"id": "...", "title": "..."}
+                    return str(reply.get("id", "") or reply.get("title", ""))
+                case str() as reply:
+                    return reply
     return ""
 
 
@@ -85,20 +89,22 @@ def _resolve_request_from_delivery(phone):
     cross-hotel misattribution when one phone receives notifications
     from multiple hotels.
     """
-    # Scope to hotels where this phone belongs to an active member
-    member_hotel_ids = HotelMembership.objects.filter(
+    # Scope to hotels where this phone belongs to an active member.
+    # EXISTS lets the planner stop at the first matching membership.
+    is_member_hotel = HotelMembership.objects.filter(
+        hotel_id=OuterRef("hotel_id"),
         user__phone=phone,
         is_active=True,
-    ).values_list("hotel_id", flat=True)
+    )
 
     record = (
         DeliveryRecord.objects.filter(
+            Exists(is_member_hotel),
             channel="WHATSAPP",
             target=phone,
             request__isnull=False,
             acknowledged_at__isnull=True,
             status__in=[DeliveryRecord.Status.SENT, DeliveryRecord.Status.DELIVERED],
-            hotel_id__in=member_hotel_ids,
         )
         .select_related("request", "request__hotel")
         .order_by("-created_at")
@@ -121,7 +127,7 @@ def handle_inbound_message(payload):
     2. ServiceRequest.acknowledged_at + status=ACKNOWLEDGED — request-level ack
     """
     source = payload.get("payload", {}).get("source", "") or payload.get("source", "")
-    phone = re.sub(r"\D", "", source)
+    phone = _NON_DIGITS_RE.sub("", source)
     if not phone:
         return
 
@@ -172,7 +178,7 @@ def handle_inbound_message(payload):
             # Fall back to service window
             window = WhatsAppServiceWindow.objects.filter(
                 phone=phone,
-            ).order_by("-last_inbound_at").first()
+            ).select_related("hotel").order_by("-last_inbound_at").first()
             if window:
                 hotel = window.hotel
             else:
@@ -225,7 +231,12 @@ def _acknowledge_request(req, phone, now):
     Reuses the same CREATED→ACKNOWLEDGED transition as the dashboard acknowledge view.
     """
     with transaction.atomic():
-        req = ServiceRequest.objects.select_for_update().get(pk=req.pk)
+        # Lock only the request row; hotel rides along for the SSE publish below
+        req = (
+            ServiceRequest.objects.select_related("hotel")
+            .select_for_update(of=("self",))
+            .get(pk=req.pk)
+        )
 
         if req.status != ServiceRequest.Status.CREATED:
             return  # Already acknowledged or in terminal state
@@ -337,7 +348,7 @@ def _send_session_text(phone, text):
 
 def _normalize_phone(raw):
     """Strip non-digits from phone number."""
-    return re.sub(r'\D', '', raw)
+    return _NON_DIGITS_RE.sub('', raw)
 
 
 def _resolve_invite_delivery(postback, payload):
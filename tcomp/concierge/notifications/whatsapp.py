@@ -1,7 +1,7 @@
 import logging
 
 from django.conf import settings
-from django.db import connection
+from django.db import IntegrityError, connection, transaction
 from django.db.models import Q
 
 from concierge.models import (
@@ -67,7 +67,7 @@ class WhatsAppAdapter(ChannelAdapter):
             scope_q,
             channel=NotificationRoute.Channel.WHATSAPP,
             is_active=True,
-        ).order_by("target", "id")
+        ).only("id", "channel", "target").order_by("target", "id")
 
         # Dedupe by target
         if connection.vendor == "postgresql":
@@ -86,12 +86,6 @@ class WhatsAppAdapter(ChannelAdapter):
             send_whatsapp_template_notification,
         )
 
-        # Idempotency: one delivery per (channel, request, escalation_tier, route)
-        idempotency_key = (
-            f"wa:{event.event_type}:{event.request.public_id}"
-            f":{event.escalation_tier or 0}:{route.id}"
-        )
-
         # Check if this phone has an active service window
         window = WhatsAppServiceWindow.objects.filter(
             hotel=event.hotel, phone=route.target,
@@ -99,17 +93,8 @@ class WhatsAppAdapter(ChannelAdapter):
         use_session = window and window.is_active
 
         record, created = DeliveryRecord.objects.get_or_create(
-            idempotency_key=idempotency_key,
-            defaults={
-                "hotel": event.hotel,
-                "route": route,
-                "request": event.request,
-                "channel": "WHATSAPP",
-                "target": route.target,
-                "event_type": event.event_type,
-                "status": DeliveryRecord.Status.QUEUED,
-                "message_type": "SESSION" if use_session else "TEMPLATE",
-            },
+            idempotency_key=self._idempotency_key(route, event),
+            defaults=self._record_fields(route, event, use_session),
         )
         if not created:
             return record  # Already sent/queued — skip duplicate
@@ -123,6 +108,75 @@ class WhatsAppAdapter(ChannelAdapter):
 
         return record
 
+    def send_many(self, routes, event):
+        """Batch send(): one window lookup, one existence check and one INSERT."""
+        from .tasks import (
+            send_whatsapp_session_notification,
+            send_whatsapp_template_notification,
+        )
+
+        keys = [self._idempotency_key(route, event) for route in routes]
+        existing = set(
+            DeliveryRecord.objects.filter(idempotency_key__in=keys)
+            .values_list("idempotency_key", flat=True)
+        )
+        todo = [(route, key) for route, key in zip(routes, keys) if key not in existing]
+        if not todo:
+            return
+
+        # One clock read and one query decide the path for the whole batch
+        active_phones = set(
+            WhatsAppServiceWindow.objects.filter(
+                hotel=event.hotel,
+                phone__in=[route.target for route, _ in todo],
+                last_inbound_at__gt=WhatsAppServiceWindow.active_cutoff(),
+            ).values_list("phone", flat=True)
+        )
+        pending = []
+        for route, key in todo:
+            use_session = route.target in active_phones
+            pending.append(DeliveryRecord(
+                idempotency_key=key, **self._record_fields(route, event, use_session),
+            ))
+        try:
+            with transaction.atomic():
+                records = DeliveryRecord.objects.bulk_create(pending)
+        except IntegrityError:
+            # A concurrent dispatch claimed a key first — resolve per route
+            super().send_many(routes, event)
+            return
+
+        params = self._build_params(event)
+        for record in records:
+            task = (
+                send_whatsapp_session_notification
+                if record.message_type == "SESSION"
+                else send_whatsapp_template_notification
+            )
+            try:
+                task.delay(record.id, params)
+            except Exception:
+                logger.exception("Failed to enqueue WhatsApp for %s on %s", record.target, event.event_type)
+
+    def _idempotency_key(self, route, event):
+        # One delivery per (channel, request, escalation_tier, route)
+        return (
+            f"wa:{event.event_type}:{event.request.public_id}"
+            f":{event.escalation_tier or 0}:{route.id}"
+        )
+
+    def _record_fields(self, route, event, use_session):
+        return {
+            "hotel": event.hotel,
+            "route": route,
+            "request": event.request,
+            "channel": "WHATSAPP",
+            "target": route.target,
+            "event_type": event.event_type,
+            "status": DeliveryRecord.Status.QUEUED,
+            "message_type": "SESSION" if use_session else "TEMPLATE",
+        }
+
     def _build_params(self, event):
         """Build notification params (used by both template and session tasks)."""
         req = event.request
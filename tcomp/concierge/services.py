@@ -917,10 +917,14 @@ def check_escalations():
 
     for hotel in hotels:
         tier_minutes = hotel.escalation_tier_minutes or settings.ESCALATION_TIER_MINUTES
+        # Preload everything the notification adapters read per request
         pending_requests = ServiceRequest.objects.filter(
             hotel=hotel,
             status=ServiceRequest.Status.CREATED,
-        ).select_related('department', 'guest_stay')
+        ).select_related(
+            'department', 'guest_stay__guest', 'experience', 'event',
+            'special_request_offering',
+        )
 
         for req in pending_requests:
             elapsed = (now - req.created_at).total_seconds() / 60
@@ -1020,7 +1024,10 @@ def send_response_due_reminders():
         status=ServiceRequest.Status.CREATED,
         response_due_at__lt=now,
         reminder_sent_at__isnull=True,
-    ).select_related('department', 'hotel', 'guest_stay', 'special_request_offering')
+    ).select_related(
+        'department', 'hotel', 'guest_stay__guest', 'experience', 'event',
+        'special_request_offering',
+    )
 
     from .notifications import NotificationEvent, dispatch_notification
     for req in overdue:
@@ -17,7 +17,7 @@ from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
 from django.conf import settings
-from django.test import TestCase, override_settings
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.utils import timezone
 from rest_framework.test import APIClient
 
@@ -49,8 +49,8 @@ class InviteSetupMixin:
     """Shared fixtures: hotel (with invites enabled), users, WA template."""
 
     @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
+    def setUpTestData(cls):
+        super().setUpTestData()
 
         cls.hotel = Hotel.objects.create(
             name='Test Hotel', slug='test-hotel',
@@ -410,7 +410,7 @@ class GuestInviteAPITest(InviteSetupMixin, TestCase):
 # Token lifecycle tests
 # ---------------------------------------------------------------------------
 
-class InviteTokenTest(TestCase):
+class InviteTokenTest(SimpleTestCase):
 
     def test_generate_and_verify_roundtrip(self):
         token = generate_invite_token(42, 1)
@@ -610,60 +610,66 @@ class InviteWebhookTest(InviteSetupMixin, TestCase):
 )
 class VerifyWaInviteTest(InviteSetupMixin, TestCase):
 
-    def _make_invite(self, phone='919876500400', **kwargs):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        now = timezone.now()
+        expired_at = now - timedelta(hours=1)
+        # One invite per scenario, inserted in a single batch. Per-test
+        # transaction rollback undoes any status changes made by POSTs.
+        specs = {
+            'valid': {'guest_phone': '919876500400'},
+            'expired': {'guest_phone': '919876500401', 'expires_at': expired_at},
+            'used': {'guest_phone': '919876500402', 'status': 'USED'},
+            'version_bumped': {'guest_phone': '919876500403', 'token_version': 2},
+            'new_guest': {'guest_phone': '919876500410'},
+            'cookies': {'guest_phone': '919876500411'},
+            'existing_user': {'guest_phone': '919876500412'},
+            'existing_stay': {'guest_phone': '919876500413'},
+            'post_expired': {'guest_phone': '919876500414', 'expires_at': expired_at},
+            # Matches staff_user's phone digits
+            'staff_conflict': {'guest_phone': '9876500001'},
+            'reuse': {'guest_phone': '919876500415'},
+            'revoked': {'guest_phone': '919876500416', 'status': 'EXPIRED'},
+        }
         defaults = {
-            'hotel': self.hotel,
-            'sent_by': self.admin_user,
-            'guest_phone': phone,
+            'hotel': cls.hotel,
+            'sent_by': cls.admin_user,
             'guest_name': 'Verify Guest',
             'room_number': '401',
-            'expires_at': timezone.now() + timedelta(hours=72),
+            'expires_at': now + timedelta(hours=72),
         }
-        defaults.update(kwargs)
-        return GuestInvite.objects.create(**defaults)
+        cls.invites = dict(zip(specs, GuestInvite.objects.bulk_create([
+            GuestInvite(**{**defaults, **spec}) for spec in specs.values()
+        ])))
 
     def _verify_url(self, token):
         return VERIFY_URL.format(token=token)
 
+    def _token(self, invite):
+        return generate_invite_token(invite.id, invite.token_version)
+
     # --- GET (confirm page) ---
 
     def test_get_valid_token_returns_confirm_page(self):
-        invite = self._make_invite()
-        token = generate_invite_token(invite.id, invite.token_version)
-        resp = self.client.get(self._verify_url(token))
+        invite = self.invites['valid']
+        resp = self.client.get(self._verify_url(self._token(invite)))
         self.assertEqual(resp.status_code, 200)
         self.assertContains(resp, invite.guest_name)
 
-    def test_get_invalid_token_returns_error(self):
-        resp = self.client.get(self._verify_url('bogus-token'))
-        self.assertEqual(resp.status_code, 200)  # renders error template
-        self.assertContains(resp, 'invalid')
-
     def test_get_expired_invite_returns_error(self):
-        invite = self._make_invite(
-            phone='919876500401',
-            expires_at=timezone.now() - timedelta(hours=1),
-        )
-        token = generate_invite_token(invite.id, invite.token_version)
-        resp = self.client.get(self._verify_url(token))
+        resp = self.client.get(self._verify_url(self._token(self.invites['expired'])))
         self.assertEqual(resp.status_code, 200)
         self.assertContains(resp, 'expired')
 
     def test_get_used_invite_returns_error(self):
-        invite = self._make_invite(phone='919876500402')
-        invite.status = 'USED'
-        invite.save()
-        token = generate_invite_token(invite.id, invite.token_version)
-        resp = self.client.get(self._verify_url(token))
+        resp = self.client.get(self._verify_url(self._token(self.invites['used'])))
         self.assertEqual(resp.status_code, 200)
         self.assertContains(resp, 'already')
 
     def test_get_version_mismatch_returns_error(self):
-        invite = self._make_invite(phone='919876500403')
-        # Generate token with version 1, but set invite to version 2
-        token = generate_invite_token(invite.id, 1)
-        invite.token_version = 2
-        invite.save()
+        # Token generated with version 1, but the invite is at version 2
+        token = generate_invite_token(self.invites['version_bumped'].id, 1)
         resp = self.client.get(self._verify_url(token))
         self.assertEqual(resp.status_code, 200)
         self.assertContains(resp, 'no longer valid')
@@ -671,9 +677,8 @@ class VerifyWaInviteTest(InviteSetupMixin, TestCase):
     # --- POST (login) ---
 
     def test_post_creates_guest_user_and_stay(self):
-        invite = self._make_invite(phone='919876500410')
-        token = generate_invite_token(invite.id, invite.token_version)
-        resp = self.client.post(self._verify_url(token))
+        invite = self.invites['new_guest']
+        resp = self.client.post(self._verify_url(self._token(invite)))
         self.assertEqual(resp.status_code, 302)  # redirect
         self.assertIn(f'/h/{self.hotel.slug}/', resp['Location'])
 
@@ -695,94 +700,87 @@ class VerifyWaInviteTest(InviteSetupMixin, TestCase):
         self.assertTrue(stay.is_active)
 
     def test_post_sets_auth_cookies(self):
-        invite = self._make_invite(phone='919876500411')
-        token = generate_invite_token(invite.id, invite.token_version)
-        resp = self.client.post(self._verify_url(token))
+        resp = self.client.post(self._verify_url(self._token(self.invites['cookies'])))
         self.assertIn('access_token', resp.cookies)
 
     def test_post_reuses_existing_guest_user(self):
-        phone = '919876500412'
+        invite = self.invites['existing_user']
         existing_user = User.objects.create_guest_user(
-            phone=phone, first_name='Existing', last_name='Guest',
+            phone=invite.guest_phone, first_name='Existing', last_name='Guest',
         )
-        invite = self._make_invite(phone=phone)
-        token = generate_invite_token(invite.id, invite.token_version)
-        resp = self.client.post(self._verify_url(token))
+        resp = self.client.post(self._verify_url(self._token(invite)))
         self.assertEqual(resp.status_code, 302)
         invite.refresh_from_db()
         self.assertEqual(invite.guest_user.pk, existing_user.pk)
 
     def test_post_reuses_existing_active_stay(self):
-        phone = '919876500413'
-        user = User.objects.create_guest_user(phone=phone, first_name='Stay', last_name='Guest')
+        invite = self.invites['existing_stay']
+        user = User.objects.create_guest_user(
+            phone=invite.guest_phone, first_name='Stay', last_name='Guest',
+        )
         existing_stay = GuestStay.objects.create(
             guest=user, hotel=self.hotel, room_number='500',
             is_active=True, expires_at=timezone.now() + timedelta(hours=12),
         )
-        invite = self._make_invite(phone=phone)
-        token = generate_invite_token(invite.id, invite.token_version)
-        resp = self.client.post(self._verify_url(token))
+        resp = self.client.post(self._verify_url(self._token(invite)))
         self.assertEqual(resp.status_code, 302)
         invite.refresh_from_db()
         self.assertEqual(invite.guest_stay.pk, existing_stay.pk)
 
     def test_post_expired_invite_shows_error(self):
-        invite = self._make_invite(
-            phone='919876500414',
-            expires_at=timezone.now() - timedelta(hours=1),
-        )
-        token = generate_invite_token(invite.id, invite.token_version)
-        resp = self.client.post(self._verify_url(token))
+        invite = self.invites['post_expired']
+        resp = self.client.post(self._verify_url(self._token(invite)))
         self.assertEqual(resp.status_code, 200)  # error template
         invite.refresh_from_db()
         self.assertEqual(invite.status, 'EXPIRED')  # POST marks as expired
 
     def test_post_staff_phone_conflict_shows_error(self):
         """If the phone belongs to a staff user, show error with login link."""
-        invite = self._make_invite(phone='9876500001')  # matches staff_user's phone digits
+        invite = self.invites['staff_conflict']
         # Create a staff user with matching phone
-        staff = User.objects.create_user(
+        User.objects.create_user(
             email='conflict@test.com', password='pass',
             phone='9876500001', user_type='STAFF',
         )
-        token = generate_invite_token(invite.id, invite.token_version)
-        resp = self.client.post(self._verify_url(token))
+        resp = self.client.post(self._verify_url(self._token(invite)))
         self.assertEqual(resp.status_code, 200)
         self.assertContains(resp, 'staff account')
 
     def test_post_used_invite_cannot_be_reused(self):
-        invite = self._make_invite(phone='919876500415')
-        token = generate_invite_token(invite.id, invite.token_version)
+        url = self._verify_url(self._token(self.invites['reuse']))
         # First POST — should succeed
-        resp1 = self.client.post(self._verify_url(token))
+        resp1 = self.client.post(url)
         self.assertEqual(resp1.status_code, 302)
         # Second POST — invite is now USED
-        resp2 = self.client.post(self._verify_url(token))
+        resp2 = self.client.post(url)
         self.assertEqual(resp2.status_code, 200)  # error page
         self.assertContains(resp2, 'already')
 
     def test_post_revoked_invite_shows_error(self):
-        invite = self._make_invite(phone='919876500416')
-        invite.status = 'EXPIRED'
-        invite.save()
-        token = generate_invite_token(invite.id, invite.token_version)
-        resp = self.client.post(self._verify_url(token))
+        resp = self.client.post(self._verify_url(self._token(self.invites['revoked'])))
         self.assertEqual(resp.status_code, 200)
         self.assertContains(resp, 'cancelled')
 
+
+class VerifyWaInviteNoDBTest(SimpleTestCase):
+    """Verify view paths that return before any invite lookup."""
+
+    def _verify_url(self, token):
+        return VERIFY_URL.format(token=token)
+
+    def test_get_invalid_token_returns_error(self):
+        resp = self.client.get(self._verify_url('bogus-token'))
+        self.assertEqual(resp.status_code, 200)  # renders error template
+        self.assertContains(resp, 'invalid')
+
     def test_put_returns_405(self):
-        invite = self._make_invite(phone='919876500417')
-        token = generate_invite_token(invite.id, invite.token_version)
-        resp = self.client.put(self._verify_url(token))
+        # Method check runs before the token is even decoded
+        resp = self.client.put(self._verify_url('bogus-token'))
         self.assertEqual(resp.status_code, 405)
 
 
 # Helper for mocking transaction.atomic as a passthrough
-from contextlib import contextmanager
-
-@contextmanager
-def _noop_atomic(*args, **kwargs):
-    yield
+from contextlib import nullcontext
 
 def transaction_atomic_passthrough(*args, **kwargs):
-    return _noop_atomic()
+    return nullcontext()
@@ -9,8 +9,10 @@ Covers:
 - Case-insensitive email lookup with duplicate handling
 - Resend invite temp-password gating (last_login guard)
 """
+from datetime import timedelta
 from unittest.mock import patch
 
+from django.contrib.auth.hashers import make_password
 from django.test import TestCase
 from django.utils import timezone
 from rest_framework.test import APIClient
@@ -21,6 +23,17 @@ from users.models import User
 
 class MemberInviteTestCase(TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._task_patcher = patch('concierge.tasks.send_staff_invite_notification_task.delay')
+        cls._mock_task = cls._task_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._task_patcher.stop()
+        super().tearDownClass()
+
     @classmethod
     def setUpTestData(cls):
         cls.hotel = Hotel.objects.create(
@@ -33,6 +46,8 @@ class MemberInviteTestCase(TestCase):
         cls.hotel.fallback_department = dept
         cls.hotel.save(update_fields=['fallback_department'])
         cls.dept = dept
+        cls.url = f'/api/v1/hotels/{cls.hotel.slug}/admin/members/'
+        cls._resend_url_tpl = f'{cls.url}{{id}}/resend-invite/'
 
         cls.superadmin = User.objects.create_user(
             email='super@test.com', password='pass', user_type='STAFF',
@@ -42,10 +57,30 @@ class MemberInviteTestCase(TestCase):
             role=HotelMembership.Role.SUPERADMIN,
         )
 
+        # Resend fixtures — created directly so resend tests skip the invite POST
+        email_user = User(email='resend@example.com', user_type='STAFF')
+        email_user.set_unusable_password()
+        rotate_user = User(email='rotate@example.com', user_type='STAFF')
+        rotate_user.set_password('first-temp-pw')
+        phone_user = User(phone='919876500099', user_type='STAFF')
+        phone_user.set_unusable_password()
+        for user in (email_user, rotate_user, phone_user):
+            user.save()
+        (
+            cls.resend_email_membership,
+            cls.resend_rotate_membership,
+            cls.resend_phone_membership,
+        ) = [
+            HotelMembership.objects.create(
+                user=user, hotel=cls.hotel,
+                role=HotelMembership.Role.STAFF, department=dept,
+            )
+            for user in (email_user, rotate_user, phone_user)
+        ]
+
     def setUp(self):
         self.client = APIClient()
         self.client.force_authenticate(user=self.superadmin)
-        self.url = f'/api/v1/hotels/{self.hotel.slug}/admin/members/'
 
     def _invite(self, **overrides):
         data = {
@@ -62,45 +97,47 @@ class MemberInviteTestCase(TestCase):
             del data['phone']
         return self.client.post(self.url, data, format='json')
 
+    def _invited_user(self, resp):
+        """Fetch the invited user by the id in the invite response."""
+        return User.objects.get(pk=resp.data['user_id'])
+
     # ------------------------------------------------------------------
-    # New user paths
+    # Temp password by contact type (new users + reused user with phone)
     # ------------------------------------------------------------------
 
-    @patch('concierge.tasks.send_staff_invite_notification_task.delay')
-    def test_email_only_new_user_gets_temp_password(self, _mock_commit):
-        resp = self._invite(email='newstaff@example.com')
-        self.assertEqual(resp.status_code, 201)
-        self.assertIn('temp_password', resp.data)
-        self.assertTrue(len(resp.data['temp_password']) > 0)
-
-        user = User.objects.get(email='newstaff@example.com')
-        self.assertTrue(user.has_usable_password())
-        self.assertTrue(user.check_password(resp.data['temp_password']))
-
-    @patch('concierge.tasks.send_staff_invite_notification_task.delay')
-    def test_phone_only_new_user_no_temp_password(self, _mock_commit):
-        resp = self._invite(phone='919876543210')
-        self.assertEqual(resp.status_code, 201)
-        self.assertNotIn('temp_password', resp.data)
-
-        user = User.objects.get(phone='919876543210')
-        self.assertFalse(user.has_usable_password())
-
-    @patch('concierge.tasks.send_staff_invite_notification_task.delay')
-    def test_email_and_phone_new_user_no_temp_password(self, _mock_commit):
-        resp = self._invite(email='both@example.com', phone='919876500000')
-        self.assertEqual(resp.status_code, 201)
-        self.assertNotIn('temp_password', resp.data)
+    def test_temp_password_by_contact_type(self):
+        """Only email-only invites for users without a phone get a temp password."""
+        existing = User(
+            email='hasphone@example.com', phone='919876500001', user_type='STAFF',
+        )
+        existing.set_unusable_password()
+        existing.save()
 
-        user = User.objects.get(email='both@example.com')
-        self.assertFalse(user.has_usable_password())
+        cases = [
+            # (label, invite fields, expect temp_password, expect usable password)
+            ('new email-only', {'email': 'newstaff@example.com'}, True, True),
+            ('new phone-only', {'phone': '919876543210'}, False, False),
+            ('new email+phone', {'email': 'both@example.com', 'phone': '919876500000'}, False, False),
+            # Reused user who has phone should not get temp password even if email-only invite
+            ('reused with phone', {'email': 'hasphone@example.com'}, False, False),
+        ]
+        for label, fields, expect_temp_pw, expect_usable in cases:
+            with self.subTest(label):
+                resp = self._invite(**fields)
+                self.assertEqual(resp.status_code, 201)
+                self.assertEqual('temp_password' in resp.data, expect_temp_pw)
+
+                user = self._invited_user(resp)
+                self.assertEqual(user.has_usable_password(), expect_usable)
+                if expect_temp_pw:
+                    self.assertTrue(len(resp.data['temp_password']) > 0)
+                    self.assertTrue(user.check_password(resp.data['temp_password']))
 
     # ------------------------------------------------------------------
     # Reused user paths
     # ------------------------------------------------------------------
 
-    @patch('concierge.tasks.send_staff_invite_notification_task.delay')
-    def test_reused_email_only_user_unusable_pw_gets_temp(self, _mock_commit):
+    def test_reused_email_only_user_unusable_pw_gets_temp(self):
         existing = User(email='reuse@example.com', phone='', user_type='STAFF')
         existing.set_unusable_password()
         existing.save()
@@ -113,8 +150,7 @@ class MemberInviteTestCase(TestCase):
         self.assertTrue(existing.has_usable_password())
         self.assertTrue(existing.check_password(resp.data['temp_password']))
 
-    @patch('concierge.tasks.send_staff_invite_notification_task.delay')
-    def test_reused_user_with_password_keeps_it(self, _mock_commit):
+    def test_reused_user_with_password_keeps_it(self):
         existing = User.objects.create_user(
             email='haspass@example.com', password='existing-pw', user_type='STAFF',
         )
@@ -126,31 +162,16 @@ class MemberInviteTestCase(TestCase):
         existing.refresh_from_db()
         self.assertTrue(existing.check_password('existing-pw'))
 
-    @patch('concierge.tasks.send_staff_invite_notification_task.delay')
-    def test_reused_user_with_phone_no_temp_password(self, _mock_commit):
-        """Reused user who has phone should not get temp password even if email-only invite."""
-        existing = User(
-            email='hasphone@example.com', phone='919876500001', user_type='STAFF',
-        )
-        existing.set_unusable_password()
-        existing.save()
-
-        resp = self._invite(email='hasphone@example.com')
-        self.assertEqual(resp.status_code, 201)
-        self.assertNotIn('temp_password', resp.data)
-
     # ------------------------------------------------------------------
     # Reactivation
     # ------------------------------------------------------------------
 
-    @patch('concierge.tasks.send_staff_invite_notification_task.delay')
-    def test_reused_inactive_user_reactivated(self, _mock_commit):
+    def test_reused_inactive_user_reactivated(self):
         """Inactive user should be reactivated on invite."""
         inactive = User.objects.create_user(
             email='inactive@example.com', password='pass', user_type='STAFF',
+            is_active=False,
         )
-        inactive.is_active = False
-        inactive.save()
 
         resp = self._invite(email='inactive@example.com')
         self.assertEqual(resp.status_code, 201)
@@ -162,8 +183,7 @@ class MemberInviteTestCase(TestCase):
     # Case-insensitive email lookup
     # ------------------------------------------------------------------
 
-    @patch('concierge.tasks.send_staff_invite_notification_task.delay')
-    def test_case_insensitive_email_lookup(self, _mock_commit):
+    def test_case_insensitive_email_lookup(self):
         existing = User.objects.create_user(
             email='Mixed@Example.COM', password='pass', user_type='STAFF',
         )
@@ -173,15 +193,19 @@ class MemberInviteTestCase(TestCase):
         # Should reuse the existing user, not create a new one
         self.assertEqual(resp.data['user_id'], existing.id)
 
-    @patch('concierge.tasks.send_staff_invite_notification_task.delay')
-    def test_duplicate_case_variant_emails_uses_oldest(self, _mock_commit):
+    def test_duplicate_case_variant_emails_uses_oldest(self):
         """When multiple users match case-insensitively, use the oldest."""
-        older = User.objects.create_user(
-            email='DUP@example.com', password='pass', user_type='STAFF',
-        )
-        User.objects.create_user(
-            email='dup@example.com', password='pass2', user_type='STAFF',
-        )
+        now = timezone.now()
+        older, _ = User.objects.bulk_create([
+            User(
+                email='DUP@example.com', password=make_password(None),
+                user_type='STAFF', date_joined=now - timedelta(days=1),
+            ),
+            User(
+                email='dup@example.com', password=make_password(None),
+                user_type='STAFF', date_joined=now,
+            ),
+        ])
 
         resp = self._invite(email='Dup@Example.com')
         self.assertEqual(resp.status_code, 201)
@@ -192,75 +216,54 @@ class MemberInviteTestCase(TestCase):
     # ------------------------------------------------------------------
 
     def _resend(self, membership_id):
-        url = f'/api/v1/hotels/{self.hotel.slug}/admin/members/{membership_id}/resend-invite/'
-        return self.client.post(url)
+        return self.client.post(self._resend_url_tpl.format(id=membership_id))
 
-    @patch('concierge.tasks.send_staff_invite_notification_task.delay')
-    def test_resend_email_only_pre_login_returns_temp_password(self, _mock_task):
+    def test_resend_email_only_pre_login_returns_temp_password(self):
         """Resend for email-only user who never logged in returns temp_password."""
-        resp = self._invite(email='resend1@example.com')
-        self.assertEqual(resp.status_code, 201)
-        membership_id = resp.data['id']
-
-        resend_resp = self._resend(membership_id)
+        resend_resp = self._resend(self.resend_email_membership.id)
         self.assertEqual(resend_resp.status_code, 200)
         self.assertIn('temp_password', resend_resp.data)
         self.assertTrue(len(resend_resp.data['temp_password']) > 0)
 
         # New temp password should be usable
-        user = User.objects.get(email='resend1@example.com')
+        user = User.objects.get(pk=self.resend_email_membership.user_id)
         self.assertTrue(user.check_password(resend_resp.data['temp_password']))
 
-    @patch('concierge.tasks.send_staff_invite_notification_task.delay')
-    def test_resend_email_only_post_login_no_temp_password(self, _mock_task):
+    def test_resend_email_only_post_login_no_temp_password(self):
         """Resend for email-only user who HAS logged in does not overwrite password."""
-        resp = self._invite(email='resend2@example.com')
-        self.assertEqual(resp.status_code, 201)
-        membership_id = resp.data['id']
-
         # Simulate login
-        user = User.objects.get(email='resend2@example.com')
-        user.last_login = timezone.now()
-        user.save(update_fields=['last_login'])
+        User.objects.filter(pk=self.resend_email_membership.user_id).update(
+            last_login=timezone.now(),
+        )
 
-        resend_resp = self._resend(membership_id)
+        resend_resp = self._resend(self.resend_email_membership.id)
         self.assertEqual(resend_resp.status_code, 200)
         self.assertNotIn('temp_password', resend_resp.data)
 
-    @patch('concierge.tasks.send_staff_invite_notification_task.delay')
-    def test_resend_rotates_temp_password(self, _mock_task):
+    def test_resend_rotates_temp_password(self):
         """Each resend generates a fresh temp password (old one stops working)."""
-        resp = self._invite(email='resend3@example.com')
-        first_pw = resp.data['temp_password']
-
-        membership_id = resp.data['id']
-        resend_resp = self._resend(membership_id)
+        first_pw = 'first-temp-pw'
+        resend_resp = self._resend(self.resend_rotate_membership.id)
         second_pw = resend_resp.data['temp_password']
 
         self.assertNotEqual(first_pw, second_pw)
 
-        user = User.objects.get(email='resend3@example.com')
+        user = User.objects.get(pk=self.resend_rotate_membership.user_id)
         self.assertFalse(user.check_password(first_pw))
         self.assertTrue(user.check_password(second_pw))
 
-    @patch('concierge.tasks.send_staff_invite_notification_task.delay')
-    def test_resend_phone_user_no_temp_password(self, _mock_task):
+    def test_resend_phone_user_no_temp_password(self):
         """Resend for user with phone does not return temp_password."""
-        resp = self._invite(phone='919876500099')
-        self.assertEqual(resp.status_code, 201)
-        membership_id = resp.data['id']
-
-        resend_resp = self._resend(membership_id)
+        resend_resp = self._resend(self.resend_phone_membership.id)
         self.assertEqual(resend_resp.status_code, 200)
         self.assertNotIn('temp_password', resend_resp.data)
 
-    @patch('concierge.tasks.send_staff_invite_notification_task.delay',
-           side_effect=Exception('broker down'))
-    def test_resend_broker_down_still_returns_temp_password(self, _mock_task):
+    def test_resend_broker_down_still_returns_temp_password(self):
         """If task enqueue fails, temp_password is still returned."""
-        resp = self._invite(email='resend4@example.com')
-        membership_id = resp.data['id']
-
-        resend_resp = self._resend(membership_id)
+        with patch(
+            'concierge.tasks.send_staff_invite_notification_task.delay',
+            side_effect=Exception('broker down'),
+        ):
+            resend_resp = self._resend(self.resend_email_membership.id)
         self.assertEqual(resend_resp.status_code, 200)
         self.assertIn('temp_password', resend_resp.data)
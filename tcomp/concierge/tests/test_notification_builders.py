@@ -0,0 +1,147 @@
+"""DB-free tests for notification adapter builders and enabled checks.
+
+Covers:
+- PushAdapter: title/body builders
+- WhatsAppAdapter: enabled check, non-request events skipped
+
+Everything here runs on unsaved model instances, so the classes use
+SimpleTestCase and skip the per-test transaction entirely. DB-backed
+adapter tests live in test_notifications.
+"""
+from django.test import SimpleTestCase, override_settings
+
+from concierge.models import Department, GuestStay, Hotel, ServiceRequest
+from concierge.notifications.base import NotificationEvent
+from concierge.notifications.push import PushAdapter
+from concierge.notifications.whatsapp import WhatsAppAdapter
+
+
+class NotificationStubMixin:
+    """Unsaved hotel, department and guest stay — never touches the DB."""
+
+    def setUp(self):
+        super().setUp()
+        self.hotel = Hotel(
+            name='Test Hotel', slug='test-hotel',
+            whatsapp_notifications_enabled=True,
+        )
+        self.dept = Department(hotel=self.hotel, name='Spa', slug='spa')
+        self.stay = GuestStay(hotel=self.hotel, room_number='101')
+
+    def _make_event(self, **kwargs):
+        """Build a NotificationEvent around an unsaved ServiceRequest."""
+        defaults = {
+            'event_type': 'request.created',
+            'hotel': self.hotel,
+            'department': self.dept,
+            'request': ServiceRequest(
+                hotel=self.hotel,
+                guest_stay=self.stay,
+                department=self.dept,
+                request_type='BOOKING',
+            ),
+        }
+        defaults.update(kwargs)
+        return NotificationEvent(**defaults)
+
+
+# ---------------------------------------------------------------------------
+# PushAdapter
+# ---------------------------------------------------------------------------
+
+class PushAdapterTitleTest(NotificationStubMixin, SimpleTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.adapter = PushAdapter()
+
+    def test_request_created_title(self):
+        event = self._make_event(event_type='request.created')
+        self.assertEqual(self.adapter._build_title(event), 'New request: Spa')
+
+    def test_escalation_title(self):
+        event = self._make_event(event_type='escalation', escalation_tier=2)
+        self.assertEqual(self.adapter._build_title(event), 'Escalation: Spa')
+
+    def test_response_due_title(self):
+        event = self._make_event(event_type='response_due')
+        self.assertEqual(self.adapter._build_title(event), 'Reminder: Spa')
+
+    def test_after_hours_uses_original_dept_name(self):
+        """After-hours title should show the original department, not the fallback."""
+        fallback_dept = Department(
+            hotel=self.hotel, name='Front Desk', slug='front-desk',
+        )
+        event = self._make_event(
+            event_type='after_hours_fallback',
+            department=fallback_dept,
+            extra={'original_department_name': 'Spa'},
+        )
+        title = self.adapter._build_title(event)
+        self.assertEqual(title, 'After-hours request: Spa')
+        self.assertNotIn('Front Desk', title)
+
+    def test_after_hours_falls_back_to_dept_name_if_no_extra(self):
+        event = self._make_event(event_type='after_hours_fallback')
+        self.assertEqual(self.adapter._build_title(event), 'After-hours request: Spa')
+
+    def test_daily_digest_title(self):
+        event = NotificationEvent(
+            event_type='daily_digest', hotel=self.hotel,
+            extra={'total_requests': 5, 'confirmed': 3, 'pending': 2},
+        )
+        self.assertEqual(self.adapter._build_title(event), 'Daily Summary')
+
+
+class PushAdapterBodyTest(NotificationStubMixin, SimpleTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.adapter = PushAdapter()
+
+    def test_request_body_format(self):
+        event = self._make_event()
+        body = self.adapter._build_notification_body(event)
+        self.assertIn('Room 101', body)
+        self.assertIn('BOOKING', body)
+
+    def test_daily_digest_body(self):
+        event = NotificationEvent(
+            event_type='daily_digest', hotel=self.hotel,
+            extra={'total_requests': 10, 'confirmed': 7, 'pending': 3},
+        )
+        body = self.adapter._build_notification_body(event)
+        self.assertIn('10 requests today', body)
+        self.assertIn('7 confirmed', body)
+        self.assertIn('3 pending', body)
+
+
+# ---------------------------------------------------------------------------
+# WhatsAppAdapter
+# ---------------------------------------------------------------------------
+
+@override_settings(GUPSHUP_WA_API_KEY='test-key')
+class WhatsAppAdapterEnabledTest(NotificationStubMixin, SimpleTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.adapter = WhatsAppAdapter()
+
+    def test_enabled_when_hotel_flag_and_api_key(self):
+        self.assertTrue(self.adapter.is_enabled(self.hotel))
+
+    def test_disabled_when_hotel_flag_off(self):
+        self.hotel.whatsapp_notifications_enabled = False
+        self.assertFalse(self.adapter.is_enabled(self.hotel))
+
+    @override_settings(GUPSHUP_WA_API_KEY='')
+    def test_disabled_when_no_api_key(self):
+        self.assertFalse(self.adapter.is_enabled(self.hotel))
+
+    def test_skips_non_request_events(self):
+        event = NotificationEvent(
+            event_type='daily_digest', hotel=self.hotel,
+            extra={'total_requests': 5, 'confirmed': 3, 'pending': 2},
+        )
+        recipients = self.adapter.get_recipients(event)
+        self.assertEqual(recipients, [])
@@ -2,19 +2,30 @@
 
 Covers:
 - Dispatcher: fan-out to adapters, per-adapter/per-recipient error isolation
-- PushAdapter: recipient selection, title/body builders, daily_digest, after_hours_fallback
-- WhatsAppAdapter: enabled check, routing, deduplication, service window two-path, idempotency
+- PushAdapter: recipient selection, send, daily_digest
+- WhatsAppAdapter: routing, deduplication, service window two-path, idempotency
 - EmailAdapter: enabled check, routing, deduplication, idempotency, Celery task
 - Webhook: ack/esc_ack/view postback handling, delivery status updates, service window open
 - Celery tasks: template send, session send with fallback, response validation, retry logic
 - NotificationRoute API: CRUD, pagination=None, channel-specific target validation
+
+DB-free builder and enabled-check tests live in test_notification_builders.
 """
 import uuid
 from datetime import timedelta
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import requests as http_requests
+from django.contrib.auth.hashers import make_password
 from django.test import TestCase, override_settings
 from django.utils import timezone
+from resend.exceptions import (
+    ApplicationError,
+    MissingApiKeyError,
+    RateLimitError,
+    ValidationError,
+)
 from rest_framework.test import APIClient
 
 from concierge.models import (
@@ -32,14 +43,72 @@ from concierge.models import (
     ServiceRequest,
     WhatsAppServiceWindow,
 )
+from concierge.notifications import tasks as notification_tasks
 from concierge.notifications.base import NotificationEvent
 from concierge.notifications.dispatcher import dispatch_notification
 from concierge.notifications.email import EmailAdapter
 from concierge.notifications.push import PushAdapter
+from concierge.notifications.tasks import (
+    send_email_notification,
+    send_whatsapp_session_notification,
+    send_whatsapp_template_notification,
+)
+from concierge.notifications.webhook import (
+    _handle_request_view_postback,
+    handle_inbound_message,
+    handle_message_event,
+)
 from concierge.notifications.whatsapp import WhatsAppAdapter
+from concierge.services import send_guest_status_update
 from users.models import User
 
 
+# ---------------------------------------------------------------------------
+# Celery .delay, Resend and Gupshup stubs
+# ---------------------------------------------------------------------------
+
+# Installed once for the whole module instead of a @patch per test;
+# NotificationSetupMixin.setUp resets them so nothing leaks between tests.
+_DELAY_MOCKS = {
+    name: MagicMock()
+    for name in (
+        'send_push_notification_task',
+        'send_whatsapp_template_notification',
+        'send_whatsapp_session_notification',
+        'send_email_notification',
+        'send_request_status_whatsapp_task',
+    )
+}
+_RESEND_SEND = MagicMock()
+_GUPSHUP_POST = MagicMock()
+_module_patchers = []
+
+
+def _gupshup_response(status_code, body=None, text=''):
+    """Plain stand-in for a requests.Response returned by the Gupshup post."""
+    return SimpleNamespace(
+        status_code=status_code, text=text, json=lambda: body or {},
+    )
+
+
+def setUpModule():
+    for name, mock in _DELAY_MOCKS.items():
+        _module_patchers.append(
+            patch.object(getattr(notification_tasks, name), 'delay', mock)
+        )
+    _module_patchers.append(patch('resend.Emails.send', _RESEND_SEND))
+    _module_patchers.append(
+        patch.object(notification_tasks._GUPSHUP_SESSION, 'post', _GUPSHUP_POST)
+    )
+    for patcher in _module_patchers:
+        patcher.start()
+
+
+def tearDownModule():
+    while _module_patchers:
+        _module_patchers.pop().stop()
+
+
 # ---------------------------------------------------------------------------
 # Shared setup
 # ---------------------------------------------------------------------------
@@ -48,8 +117,8 @@ class NotificationSetupMixin:
     """Shared test data: hotel, department, users, guest stay, service request."""
 
     @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
+    def setUpTestData(cls):
+        super().setUpTestData()
 
         cls.hotel = Hotel.objects.create(
             name='Test Hotel', slug='test-hotel',
@@ -63,45 +132,70 @@ class NotificationSetupMixin:
             slug='deep-tissue', category='SPA',
         )
 
-        # Staff in department
-        cls.staff_user = User.objects.create_user(
-            email='staff@test.com', password='pass',
-            first_name='Staff', last_name='One', phone='+919876543210',
-        )
-        cls.staff_membership = HotelMembership.objects.create(
-            user=cls.staff_user, hotel=cls.hotel,
-            role='STAFF', department=cls.dept,
-        )
-
-        # Admin (no department)
-        cls.admin_user = User.objects.create_user(
-            email='admin@test.com', password='pass',
-            first_name='Admin', last_name='User',
-        )
-        cls.admin_membership = HotelMembership.objects.create(
-            user=cls.admin_user, hotel=cls.hotel, role='ADMIN',
-        )
+        # No test here logs in, so skip password hashing entirely. bulk_create
+        # bypasses User.save(), so phones are given already digits-only.
+        (
+            cls.staff_user,
+            cls.admin_user,
+            cls.superadmin_user,
+            cls.guest_user,
+        ) = User.objects.bulk_create([
+            User(
+                email='staff@test.com', password=make_password(None),
+                first_name='Staff', last_name='One', phone='919876543210',
+            ),
+            User(
+                email='admin@test.com', password=make_password(None),
+                first_name='Admin', last_name='User',
+            ),
+            User(
+                email='super@test.com', password=make_password(None),
+                first_name='Super', last_name='Admin',
+            ),
+            User(
+                email='guest@test.com', password=make_password(None),
+                first_name='Guest', last_name='User',
+            ),
+        ])
 
-        # Superadmin
-        cls.superadmin_user = User.objects.create_user(
-            email='super@test.com', password='pass',
-            first_name='Super', last_name='Admin',
-        )
-        cls.superadmin_membership = HotelMembership.objects.create(
-            user=cls.superadmin_user, hotel=cls.hotel, role='SUPERADMIN',
-        )
+        # Staff in department, admin (no department), superadmin
+        (
+            cls.staff_membership,
+            cls.admin_membership,
+            cls.superadmin_membership,
+        ) = HotelMembership.objects.bulk_create([
+            HotelMembership(
+                user=cls.staff_user, hotel=cls.hotel,
+                role='STAFF', department=cls.dept,
+            ),
+            HotelMembership(user=cls.admin_user, hotel=cls.hotel, role='ADMIN'),
+            HotelMembership(user=cls.superadmin_user, hotel=cls.hotel, role='SUPERADMIN'),
+        ])
 
         # Guest
-        cls.guest_user = User.objects.create_user(
-            email='guest@test.com', password='pass',
-            first_name='Guest', last_name='User',
-        )
         cls.stay = GuestStay.objects.create(
             guest=cls.guest_user, hotel=cls.hotel,
             room_number='101',
             expires_at=timezone.now() + timedelta(days=3),
         )
 
+        # Backs _make_event() when a test doesn't need its own request row
+        cls.default_request = ServiceRequest.objects.create(
+            hotel=cls.hotel, guest_stay=cls.stay,
+            department=cls.dept, request_type='BOOKING',
+        )
+
+    def setUp(self):
+        super().setUp()
+        for mock in _DELAY_MOCKS.values():
+            mock.reset_mock()
+        # Return values and side effects set by one test must not leak into
+        # the next, even for classes that only reach these stubs indirectly.
+        self.mock_post = _GUPSHUP_POST
+        self.mock_send = _RESEND_SEND
+        for stub in (self.mock_post, self.mock_send):
+            stub.reset_mock(return_value=True, side_effect=True)
+
     def _make_request(self, **kwargs):
         """Create a ServiceRequest with sensible defaults."""
         defaults = {
@@ -113,10 +207,16 @@ class NotificationSetupMixin:
         defaults.update(kwargs)
         return ServiceRequest.objects.create(**defaults)
 
+    def _reload_record(self, record):
+        """Fetch only the DeliveryRecord columns the task tests assert on."""
+        return DeliveryRecord.objects.values(
+            'status', 'message_type', 'error_message', 'provider_message_id',
+        ).get(pk=record.pk)
+
     def _make_event(self, request=None, **kwargs):
-        """Create a NotificationEvent with sensible defaults."""
+        """Create a NotificationEvent, defaulting to the shared request."""
         if request is None:
-            request = self._make_request()
+            request = self.default_request
         defaults = {
             'event_type': 'request.created',
             'hotel': self.hotel,
@@ -133,40 +233,45 @@ class NotificationSetupMixin:
 
 class DispatcherTest(NotificationSetupMixin, TestCase):
 
-    @patch('concierge.notifications.push.PushAdapter.send')
-    @patch('concierge.notifications.push.PushAdapter.get_recipients')
-    def test_fanout_calls_all_enabled_adapters(self, mock_recipients, mock_send):
-        """Dispatcher calls get_recipients + send for each enabled adapter."""
-        mock_recipients.return_value = [self.staff_membership]
-
+    # Only the push adapter is dispatched to, so the route-based adapters
+    # never query routes or hotel flags here.
+    @patch('concierge.notifications.dispatcher.ADAPTERS', [PushAdapter()])
+    @patch.object(PushAdapter, 'get_recipients')
+    @patch.object(PushAdapter, 'send')
+    def test_dispatcher_behaviors(self, mock_send, mock_get_recipients):
+        """Fan-out, adapter-level and per-recipient error isolation."""
         event = self._make_event()
-        dispatch_notification(event)
-
-        mock_recipients.assert_called_once_with(event)
-        mock_send.assert_called_once_with(self.staff_membership, event)
-
-    @patch('concierge.notifications.push.PushAdapter.send')
-    @patch('concierge.notifications.push.PushAdapter.get_recipients')
-    def test_adapter_error_isolated(self, mock_recipients, mock_send):
-        """One adapter raising doesn't block the whole dispatch."""
-        mock_recipients.side_effect = RuntimeError("boom")
-
-        event = self._make_event()
-        # Should NOT raise — error is logged and swallowed
-        dispatch_notification(event)
-
-    @patch('concierge.notifications.push.PushAdapter.send')
-    @patch('concierge.notifications.push.PushAdapter.get_recipients')
-    def test_per_recipient_error_isolated(self, mock_recipients, mock_send):
-        """One recipient failing doesn't block others."""
-        mock_recipients.return_value = [self.staff_membership, self.admin_membership]
-        mock_send.side_effect = [RuntimeError("boom"), None]
-
-        event = self._make_event()
-        dispatch_notification(event)
-
-        # Both recipients attempted
-        self.assertEqual(mock_send.call_count, 2)
+        cases = [
+            # (name, get_recipients outcome, send side_effect, expected send calls)
+            ('fanout', [self.staff_membership], None, 1),
+            # One adapter raising doesn't block the whole dispatch
+            ('adapter_error', RuntimeError("boom"), None, 0),
+            # One recipient failing doesn't block others
+            (
+                'per_recipient_error',
+                [self.staff_membership, self.admin_membership],
+                [RuntimeError("boom"), None],
+                2,
+            ),
+        ]
+        for name, recipients, send_side_effect, expected_calls in cases:
+            with self.subTest(case=name):
+                mock_get_recipients.reset_mock(return_value=True, side_effect=True)
+                mock_send.reset_mock(side_effect=True)
+                if isinstance(recipients, Exception):
+                    mock_get_recipients.side_effect = recipients
+                else:
+                    mock_get_recipients.return_value = recipients
+                mock_send.side_effect = send_side_effect
+
+                # Should NOT raise — errors are logged and swallowed
+                with self.assertNumQueries(0):
+                    dispatch_notification(event)
+
+                mock_get_recipients.assert_called_once_with(event)
+                self.assertEqual(mock_send.call_count, expected_calls)
+                if name == 'fanout':
+                    mock_send.assert_called_once_with(self.staff_membership, event)
 
 
 # ---------------------------------------------------------------------------
@@ -175,13 +280,14 @@ class DispatcherTest(NotificationSetupMixin, TestCase):
 
 class PushAdapterRecipientTest(NotificationSetupMixin, TestCase):
 
-    def setUp(self):
-        self.adapter = PushAdapter()
+    adapter = PushAdapter()
 
     def test_request_created_includes_dept_staff_and_admins(self):
         event = self._make_event(event_type='request.created')
-        recipients = self.adapter.get_recipients(event)
-        user_ids = {m.user_id for m in recipients}
+        # One query: memberships joined to their users
+        with self.assertNumQueries(1):
+            recipients = self.adapter.get_recipients(event)
+            user_ids = {m.user.id for m in recipients}
         self.assertIn(self.staff_user.id, user_ids)
         self.assertIn(self.admin_user.id, user_ids)
         self.assertIn(self.superadmin_user.id, user_ids)
@@ -192,8 +298,9 @@ class PushAdapterRecipientTest(NotificationSetupMixin, TestCase):
             hotel=self.hotel,
             extra={'total_requests': 5, 'confirmed': 3, 'pending': 2},
         )
-        recipients = self.adapter.get_recipients(event)
-        user_ids = {m.user_id for m in recipients}
+        with self.assertNumQueries(1):
+            recipients = self.adapter.get_recipients(event)
+            user_ids = {m.user.id for m in recipients}
         self.assertNotIn(self.staff_user.id, user_ids)
         self.assertIn(self.admin_user.id, user_ids)
         self.assertIn(self.superadmin_user.id, user_ids)
@@ -201,12 +308,11 @@ class PushAdapterRecipientTest(NotificationSetupMixin, TestCase):
 
 class PushAdapterSendTest(NotificationSetupMixin, TestCase):
 
-    def setUp(self):
-        self.adapter = PushAdapter()
+    adapter = PushAdapter()
 
     @patch('concierge.notifications.push.PushAdapter._build_push_body', return_value='Room 101')
-    @patch('concierge.notifications.tasks.send_push_notification_task.delay')
-    def test_creates_notification_and_enqueues_push(self, mock_delay, _):
+    def test_creates_notification_and_enqueues_push(self, _):
+        mock_delay = _DELAY_MOCKS['send_push_notification_task']
         event = self._make_event()
         notification = self.adapter.send(self.staff_membership, event)
 
@@ -216,8 +322,8 @@ class PushAdapterSendTest(NotificationSetupMixin, TestCase):
         self.assertEqual(notification.notification_type, 'NEW_REQUEST')
         mock_delay.assert_called_once()
 
-    @patch('concierge.notifications.tasks.send_push_notification_task.delay')
-    def test_daily_digest_skips_web_push(self, mock_delay):
+    def test_daily_digest_skips_web_push(self):
+        mock_delay = _DELAY_MOCKS['send_push_notification_task']
         event = NotificationEvent(
             event_type='daily_digest',
             hotel=self.hotel,
@@ -230,116 +336,27 @@ class PushAdapterSendTest(NotificationSetupMixin, TestCase):
         mock_delay.assert_not_called()
 
 
-class PushAdapterTitleTest(NotificationSetupMixin, TestCase):
-
-    def setUp(self):
-        self.adapter = PushAdapter()
-
-    def test_request_created_title(self):
-        event = self._make_event(event_type='request.created')
-        self.assertEqual(self.adapter._build_title(event), 'New request: Spa')
-
-    def test_escalation_title(self):
-        event = self._make_event(event_type='escalation', escalation_tier=2)
-        self.assertEqual(self.adapter._build_title(event), 'Escalation: Spa')
-
-    def test_response_due_title(self):
-        event = self._make_event(event_type='response_due')
-        self.assertEqual(self.adapter._build_title(event), 'Reminder: Spa')
-
-    def test_after_hours_uses_original_dept_name(self):
-        """After-hours title should show the original department, not the fallback."""
-        fallback_dept = Department.objects.create(
-            hotel=self.hotel, name='Front Desk', slug='front-desk',
-        )
-        event = self._make_event(
-            event_type='after_hours_fallback',
-            department=fallback_dept,
-            extra={'original_department_name': 'Spa'},
-        )
-        title = self.adapter._build_title(event)
-        self.assertEqual(title, 'After-hours request: Spa')
-        self.assertNotIn('Front Desk', title)
-
-    def test_after_hours_falls_back_to_dept_name_if_no_extra(self):
-        event = self._make_event(event_type='after_hours_fallback')
-        self.assertEqual(self.adapter._build_title(event), 'After-hours request: Spa')
-
-    def test_daily_digest_title(self):
-        event = NotificationEvent(
-            event_type='daily_digest', hotel=self.hotel,
-            extra={'total_requests': 5, 'confirmed': 3, 'pending': 2},
-        )
-        self.assertEqual(self.adapter._build_title(event), 'Daily Summary')
-
-
-class PushAdapterBodyTest(NotificationSetupMixin, TestCase):
-
-    def setUp(self):
-        self.adapter = PushAdapter()
-
-    def test_request_body_format(self):
-        event = self._make_event()
-        body = self.adapter._build_notification_body(event)
-        self.assertIn('Room 101', body)
-        self.assertIn('BOOKING', body)
-
-    def test_daily_digest_body(self):
-        event = NotificationEvent(
-            event_type='daily_digest', hotel=self.hotel,
-            extra={'total_requests': 10, 'confirmed': 7, 'pending': 3},
-        )
-        body = self.adapter._build_notification_body(event)
-        self.assertIn('10 requests today', body)
-        self.assertIn('7 confirmed', body)
-        self.assertIn('3 pending', body)
-
-
 # ---------------------------------------------------------------------------
 # WhatsAppAdapter
 # ---------------------------------------------------------------------------
 
-@override_settings(GUPSHUP_WA_API_KEY='test-key')
-class WhatsAppAdapterEnabledTest(NotificationSetupMixin, TestCase):
-
-    def setUp(self):
-        self.adapter = WhatsAppAdapter()
-
-    def test_enabled_when_hotel_flag_and_api_key(self):
-        self.assertTrue(self.adapter.is_enabled(self.hotel))
-
-    def test_disabled_when_hotel_flag_off(self):
-        self.hotel.whatsapp_notifications_enabled = False
-        self.assertFalse(self.adapter.is_enabled(self.hotel))
-        self.hotel.whatsapp_notifications_enabled = True  # Reset
-
-    @override_settings(GUPSHUP_WA_API_KEY='')
-    def test_disabled_when_no_api_key(self):
-        self.assertFalse(self.adapter.is_enabled(self.hotel))
-
-    def test_skips_non_request_events(self):
-        event = NotificationEvent(
-            event_type='daily_digest', hotel=self.hotel,
-            extra={'total_requests': 5, 'confirmed': 3, 'pending': 2},
-        )
-        recipients = self.adapter.get_recipients(event)
-        self.assertEqual(recipients, [])
-
-
 @override_settings(GUPSHUP_WA_API_KEY='test-key')
 class WhatsAppAdapterRoutingTest(NotificationSetupMixin, TestCase):
 
-    def setUp(self):
-        self.adapter = WhatsAppAdapter()
-        self.route = NotificationRoute.objects.create(
-            hotel=self.hotel, department=self.dept,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.adapter = WhatsAppAdapter()
+        cls.route = NotificationRoute.objects.create(
+            hotel=cls.hotel, department=cls.dept,
             channel='WHATSAPP', target='919876543210',
-            label='Staff One', created_by=self.admin_user,
+            label='Staff One', created_by=cls.admin_user,
         )
 
     def test_routes_to_department_wide_route(self):
         event = self._make_event()
-        recipients = self.adapter.get_recipients(event)
+        with self.assertNumQueries(1):
+            recipients = self.adapter.get_recipients(event)
         self.assertEqual(len(recipients), 1)
         self.assertEqual(recipients[0].target, '919876543210')
 
@@ -352,7 +369,8 @@ class WhatsAppAdapterRoutingTest(NotificationSetupMixin, TestCase):
         )
         req = self._make_request(experience=self.experience)
         event = self._make_event(request=req)
-        recipients = self.adapter.get_recipients(event)
+        with self.assertNumQueries(1):
+            recipients = self.adapter.get_recipients(event)
         targets = {r.target for r in recipients}
         self.assertIn('919876543210', targets)
         self.assertIn('919111222333', targets)
@@ -373,13 +391,10 @@ class WhatsAppAdapterRoutingTest(NotificationSetupMixin, TestCase):
         self.assertEqual(targets.count('919876543210'), 1)
 
     def test_inactive_routes_excluded(self):
-        self.route.is_active = False
-        self.route.save()
+        NotificationRoute.objects.filter(pk=self.route.pk).update(is_active=False)
         event = self._make_event()
         recipients = self.adapter.get_recipients(event)
         self.assertEqual(len(recipients), 0)
-        self.route.is_active = True
-        self.route.save()
 
 
 @override_settings(
@@ -390,16 +405,18 @@ class WhatsAppAdapterRoutingTest(NotificationSetupMixin, TestCase):
 )
 class WhatsAppAdapterSendTest(NotificationSetupMixin, TestCase):
 
-    def setUp(self):
-        self.adapter = WhatsAppAdapter()
-        self.route = NotificationRoute.objects.create(
-            hotel=self.hotel, department=self.dept,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.adapter = WhatsAppAdapter()
+        cls.route = NotificationRoute.objects.create(
+            hotel=cls.hotel, department=cls.dept,
             channel='WHATSAPP', target='919876543210',
-            label='Staff One', created_by=self.admin_user,
+            label='Staff One', created_by=cls.admin_user,
         )
 
-    @patch('concierge.notifications.tasks.send_whatsapp_template_notification.delay')
-    def test_send_template_when_no_service_window(self, mock_delay):
+    def test_send_template_when_no_service_window(self):
+        mock_delay = _DELAY_MOCKS['send_whatsapp_template_notification']
         event = self._make_event()
         record = self.adapter.send(self.route, event)
 
@@ -409,8 +426,8 @@ class WhatsAppAdapterSendTest(NotificationSetupMixin, TestCase):
         self.assertEqual(record.channel, 'WHATSAPP')
         mock_delay.assert_called_once()
 
-    @patch('concierge.notifications.tasks.send_whatsapp_session_notification.delay')
-    def test_send_session_when_active_window(self, mock_delay):
+    def test_send_session_when_active_window(self):
+        mock_delay = _DELAY_MOCKS['send_whatsapp_session_notification']
         WhatsAppServiceWindow.objects.create(
             hotel=self.hotel, phone='919876543210',
             last_inbound_at=timezone.now(),
@@ -421,8 +438,8 @@ class WhatsAppAdapterSendTest(NotificationSetupMixin, TestCase):
         self.assertEqual(record.message_type, 'SESSION')
         mock_delay.assert_called_once()
 
-    @patch('concierge.notifications.tasks.send_whatsapp_template_notification.delay')
-    def test_send_template_when_window_expired(self, mock_delay):
+    def test_send_template_when_window_expired(self):
+        mock_delay = _DELAY_MOCKS['send_whatsapp_template_notification']
         WhatsAppServiceWindow.objects.create(
             hotel=self.hotel, phone='919876543210',
             last_inbound_at=timezone.now() - timedelta(hours=24),
@@ -433,8 +450,8 @@ class WhatsAppAdapterSendTest(NotificationSetupMixin, TestCase):
         self.assertEqual(record.message_type, 'TEMPLATE')
         mock_delay.assert_called_once()
 
-    @patch('concierge.notifications.tasks.send_whatsapp_template_notification.delay')
-    def test_idempotency_prevents_duplicate(self, mock_delay):
+    def test_idempotency_prevents_duplicate(self):
+        mock_delay = _DELAY_MOCKS['send_whatsapp_template_notification']
         event = self._make_event()
         record1 = self.adapter.send(self.route, event)
         record2 = self.adapter.send(self.route, event)
@@ -442,6 +459,35 @@ class WhatsAppAdapterSendTest(NotificationSetupMixin, TestCase):
         self.assertEqual(record1.id, record2.id)
         mock_delay.assert_called_once()  # Only one task enqueued
 
+    def test_send_many_picks_path_per_route(self):
+        """Batch send checks service windows per target and skips existing keys."""
+        template_delay = _DELAY_MOCKS['send_whatsapp_template_notification']
+        session_delay = _DELAY_MOCKS['send_whatsapp_session_notification']
+        windowed = NotificationRoute.objects.create(
+            hotel=self.hotel, department=self.dept,
+            channel='WHATSAPP', target='919111222333',
+            label='Windowed', created_by=self.admin_user,
+        )
+        WhatsAppServiceWindow.objects.create(
+            hotel=self.hotel, phone='919111222333',
+            last_inbound_at=timezone.now(),
+        )
+        event = self._make_event()
+
+        self.adapter.send_many([self.route, windowed], event)
+        self.adapter.send_many([self.route, windowed], event)  # No-op: keys exist
+
+        message_types = dict(
+            DeliveryRecord.objects.filter(request=event.request)
+            .values_list('target', 'message_type')
+        )
+        self.assertEqual(message_types, {
+            '919876543210': 'TEMPLATE',
+            '919111222333': 'SESSION',
+        })
+        template_delay.assert_called_once()
+        session_delay.assert_called_once()
+
     def test_params_use_original_dept_name_for_after_hours(self):
         event = self._make_event(
             event_type='after_hours_fallback',
@@ -463,108 +509,107 @@ class WhatsAppAdapterSendTest(NotificationSetupMixin, TestCase):
 )
 class WebhookAckTest(NotificationSetupMixin, TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # View postbacks reply over a real HTTP post; keep it stubbed for
+        # every test in the class rather than patching per test.
+        patcher = patch('concierge.notifications.webhook._send_session_text')
+        cls.mock_send_session_text = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+    def setUp(self):
+        super().setUp()
+        self.mock_send_session_text.reset_mock()
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Marks the default request as delivered over WhatsApp; acking it is
+        # undone by the per-test rollback.
+        cls.sent_record = DeliveryRecord.objects.create(
+            hotel=cls.hotel, request=cls.default_request,
+            channel='WHATSAPP', target='919876543210',
+            event_type='request.created', status='SENT',
+        )
+
+    # Only postbackText (and occasionally source) varies between tests.
+    _PAYLOAD_TEMPLATE = {
+        'source': '919876543210',
+        'type': 'quick_reply',
+        'postbackText': None,
+    }
+
     def _payload(self, postback_text, source='919876543210'):
         return {
             'payload': {
+                **self._PAYLOAD_TEMPLATE,
                 'source': source,
-                'type': 'quick_reply',
                 'postbackText': postback_text,
             },
         }
 
-    def test_ack_postback_acknowledges_request(self):
-        from concierge.notifications.webhook import handle_inbound_message
-
-        req = self._make_request()
-        # Create a delivery record for this request
-        DeliveryRecord.objects.create(
-            hotel=self.hotel, request=req,
-            channel='WHATSAPP', target='919876543210',
-            event_type='request.created', status='SENT',
-        )
+    def _status(self, req):
+        return ServiceRequest.objects.values_list('status', flat=True).get(pk=req.pk)
 
+    def test_ack_postback_acknowledges_request(self):
+        req = self.default_request
         handle_inbound_message(self._payload(f'ack:{req.public_id}'))
 
-        req.refresh_from_db()
-        self.assertEqual(req.status, 'ACKNOWLEDGED')
-        self.assertIsNotNone(req.acknowledged_at)
+        status, acknowledged_at = ServiceRequest.objects.values_list(
+            'status', 'acknowledged_at',
+        ).get(pk=req.pk)
+        self.assertEqual(status, 'ACKNOWLEDGED')
+        self.assertIsNotNone(acknowledged_at)
 
         # Activity log created
-        activity = RequestActivity.objects.filter(
-            request=req, action='ACKNOWLEDGED',
-        ).first()
-        self.assertIsNotNone(activity)
-        self.assertEqual(activity.details['channel'], 'whatsapp')
+        self.assertTrue(RequestActivity.objects.filter(
+            request=req, action='ACKNOWLEDGED', details__channel='whatsapp',
+        ).exists())
 
     def test_esc_ack_postback_acknowledges_request(self):
-        from concierge.notifications.webhook import handle_inbound_message
-
         req = self._make_request()
         handle_inbound_message(self._payload(f'esc_ack:{req.public_id}:2'))
 
-        req.refresh_from_db()
-        self.assertEqual(req.status, 'ACKNOWLEDGED')
+        self.assertEqual(self._status(req), 'ACKNOWLEDGED')
 
     def test_view_postback_also_acknowledges_request(self):
         """All postback types (incl. view) trigger request-level ack per plan."""
-        from concierge.notifications.webhook import handle_inbound_message
-
         req = self._make_request()
+        handle_inbound_message(self._payload(f'view:{req.public_id}'))
 
-        with patch('concierge.notifications.webhook._send_session_text'):
-            handle_inbound_message(self._payload(f'view:{req.public_id}'))
-
-        req.refresh_from_db()
-        self.assertEqual(req.status, 'ACKNOWLEDGED')
+        self.assertEqual(self._status(req), 'ACKNOWLEDGED')
 
     def test_view_postback_sends_dashboard_url(self):
-        from concierge.notifications.webhook import handle_inbound_message
-
         req = self._make_request()
+        handle_inbound_message(self._payload(f'view:{req.public_id}'))
 
-        with patch('concierge.notifications.webhook._send_session_text') as mock_send:
-            handle_inbound_message(self._payload(f'view:{req.public_id}'))
-
-        mock_send.assert_called_once()
-        url_text = mock_send.call_args[0][1]
+        self.mock_send_session_text.assert_called_once()
+        url_text = self.mock_send_session_text.call_args[0][1]
         self.assertIn(str(req.public_id), url_text)
         self.assertIn('/dashboard/requests/', url_text)
 
     def test_already_acknowledged_noop(self):
         """Ack on already-acknowledged request does not change status."""
-        from concierge.notifications.webhook import handle_inbound_message
-
         req = self._make_request(status='ACKNOWLEDGED', acknowledged_at=timezone.now())
         handle_inbound_message(self._payload(f'ack:{req.public_id}'))
 
-        req.refresh_from_db()
-        self.assertEqual(req.status, 'ACKNOWLEDGED')
+        self.assertEqual(self._status(req), 'ACKNOWLEDGED')
 
     def test_delivery_record_acknowledged(self):
-        from concierge.notifications.webhook import handle_inbound_message
-
-        req = self._make_request()
-        record = DeliveryRecord.objects.create(
-            hotel=self.hotel, request=req,
-            channel='WHATSAPP', target='919876543210',
-            event_type='request.created', status='SENT',
-        )
-
+        req, record = self.default_request, self.sent_record
         handle_inbound_message(self._payload(f'ack:{req.public_id}'))
 
-        record.refresh_from_db()
-        self.assertIsNotNone(record.acknowledged_at)
+        self.assertTrue(DeliveryRecord.objects.filter(
+            pk=record.pk, acknowledged_at__isnull=False,
+        ).exists())
 
     def test_unknown_request_returns_silently(self):
-        from concierge.notifications.webhook import handle_inbound_message
-
         fake_id = uuid.uuid4()
         # Should not raise
         handle_inbound_message(self._payload(f'ack:{fake_id}'))
 
     def test_service_window_opened_on_postback(self):
-        from concierge.notifications.webhook import handle_inbound_message
-
         req = self._make_request()
         handle_inbound_message(self._payload(f'ack:{req.public_id}'))
 
@@ -581,8 +626,6 @@ class WebhookAckTest(NotificationSetupMixin, TestCase):
 class WebhookDeliveryStatusTest(NotificationSetupMixin, TestCase):
 
     def test_delivered_status_update(self):
-        from concierge.notifications.webhook import handle_message_event
-
         record = DeliveryRecord.objects.create(
             hotel=self.hotel, channel='WHATSAPP',
             target='919876543210', event_type='request.created',
@@ -601,8 +644,6 @@ class WebhookDeliveryStatusTest(NotificationSetupMixin, TestCase):
         self.assertIsNotNone(record.delivered_at)
 
     def test_failed_status_update(self):
-        from concierge.notifications.webhook import handle_message_event
-
         record = DeliveryRecord.objects.create(
             hotel=self.hotel, channel='WHATSAPP',
             target='919876543210', event_type='request.created',
@@ -623,8 +664,6 @@ class WebhookDeliveryStatusTest(NotificationSetupMixin, TestCase):
         self.assertIn('470', record.error_message)
 
     def test_unknown_message_id_noop(self):
-        from concierge.notifications.webhook import handle_message_event
-
         # Should not raise
         handle_message_event({
             'payload': {'gsId': 'nonexistent', 'type': 'delivered'},
@@ -652,8 +691,6 @@ class WebhookDeliverySSETest(NotificationSetupMixin, TestCase):
     @patch('concierge.notifications.webhook.transaction.on_commit', lambda fn: fn())
     def test_invite_delivery_emits_sse(self, mock_publish):
         """Delivery status update for invite-linked record should emit SSE."""
-        from concierge.notifications.webhook import handle_message_event
-
         invite, record = self._make_invite_record()
 
         handle_message_event({
@@ -669,8 +706,6 @@ class WebhookDeliverySSETest(NotificationSetupMixin, TestCase):
     @patch('concierge.notifications.webhook.publish_invite_event')
     def test_non_invite_delivery_no_sse(self, mock_publish):
         """Delivery status update for non-invite record should NOT emit SSE."""
-        from concierge.notifications.webhook import handle_message_event
-
         DeliveryRecord.objects.create(
             hotel=self.hotel, channel='WHATSAPP', target='919876543210',
             event_type='request.created', status='SENT',
@@ -686,8 +721,6 @@ class WebhookDeliverySSETest(NotificationSetupMixin, TestCase):
     @patch('concierge.notifications.webhook.publish_invite_event')
     def test_idempotent_same_status_skips_update_and_sse(self, mock_publish):
         """Repeated webhook with same status should skip update and SSE."""
-        from concierge.notifications.webhook import handle_message_event
-
         _invite, record = self._make_invite_record(status='DELIVERED')
 
         handle_message_event({
@@ -699,8 +732,6 @@ class WebhookDeliverySSETest(NotificationSetupMixin, TestCase):
     @patch('concierge.notifications.webhook.publish_invite_event')
     def test_repeated_failure_updates_error_message(self, mock_publish):
         """Repeated FAILED webhook with new error info should update error_message."""
-        from concierge.notifications.webhook import handle_message_event
-
         _invite, record = self._make_invite_record(status='FAILED', msg_id='gs-inv-err')
         record.error_message = '470: Old reason'
         record.save(update_fields=['error_message'])
@@ -723,8 +754,6 @@ class WebhookButtonTypeTest(NotificationSetupMixin, TestCase):
 
     def test_button_type_with_string_reply(self):
         """type='button' + reply as string should parse postback."""
-        from concierge.notifications.webhook import handle_inbound_message
-
         req = self._make_request()
         handle_inbound_message({
             'payload': {
@@ -738,8 +767,6 @@ class WebhookButtonTypeTest(NotificationSetupMixin, TestCase):
 
     def test_button_type_with_dict_reply(self):
         """type='button' + reply as {"id": "ack:..."} should not crash."""
-        from concierge.notifications.webhook import handle_inbound_message
-
         req = self._make_request()
         handle_inbound_message({
             'payload': {
@@ -753,8 +780,6 @@ class WebhookButtonTypeTest(NotificationSetupMixin, TestCase):
 
     def test_button_type_with_dict_reply_view(self):
         """type='button' + reply={"id": "view:..."} sends dashboard URL."""
-        from concierge.notifications.webhook import handle_inbound_message
-
         req = self._make_request()
         with patch('concierge.notifications.webhook._send_session_text') as mock_send:
             handle_inbound_message({
@@ -770,8 +795,6 @@ class WebhookButtonTypeTest(NotificationSetupMixin, TestCase):
 
     def test_button_type_with_empty_dict_reply(self):
         """type='button' + reply={} should not crash (no postback parsed)."""
-        from concierge.notifications.webhook import handle_inbound_message
-
         # Should not raise — no postback, no window, skips silently
         handle_inbound_message({
             'payload': {
@@ -785,16 +808,19 @@ class WebhookButtonTypeTest(NotificationSetupMixin, TestCase):
 class WebhookTextFallbackTest(NotificationSetupMixin, TestCase):
     """Tests for free-text replies that match button labels."""
 
-    def test_text_acknowledge_via_delivery_fallback(self):
-        """Typing 'Acknowledge' should ack the most recent pending request."""
-        from concierge.notifications.webhook import handle_inbound_message
-
-        req = self._make_request()
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # The default request becomes pending with a sent WhatsApp
+        # notification to the staff phone
         DeliveryRecord.objects.create(
-            hotel=self.hotel, request=req,
+            hotel=cls.hotel, request=cls.default_request,
             channel='WHATSAPP', target='919876543210',
             event_type='request.created', status='SENT',
         )
+
+    def test_text_acknowledge_via_delivery_fallback(self):
+        """Typing 'Acknowledge' should ack the most recent pending request."""
         handle_inbound_message({
             'payload': {
                 'source': '919876543210',
@@ -802,19 +828,11 @@ class WebhookTextFallbackTest(NotificationSetupMixin, TestCase):
                 'text': 'Acknowledge',
             },
         })
-        req.refresh_from_db()
-        self.assertEqual(req.status, 'ACKNOWLEDGED')
+        self.default_request.refresh_from_db()
+        self.assertEqual(self.default_request.status, 'ACKNOWLEDGED')
 
     def test_text_view_details_sends_url(self):
         """Typing 'View Details' should send dashboard link."""
-        from concierge.notifications.webhook import handle_inbound_message
-
-        req = self._make_request()
-        DeliveryRecord.objects.create(
-            hotel=self.hotel, request=req,
-            channel='WHATSAPP', target='919876543210',
-            event_type='request.created', status='SENT',
-        )
         with patch('concierge.notifications.webhook._send_session_text') as mock_send:
             handle_inbound_message({
                 'payload': {
@@ -823,20 +841,12 @@ class WebhookTextFallbackTest(NotificationSetupMixin, TestCase):
                     'text': 'View Details',
                 },
             })
-        req.refresh_from_db()
-        self.assertEqual(req.status, 'ACKNOWLEDGED')
+        self.default_request.refresh_from_db()
+        self.assertEqual(self.default_request.status, 'ACKNOWLEDGED')
         mock_send.assert_called_once()
 
     def test_text_on_it_acknowledges(self):
         """'On it' maps to ack action."""
-        from concierge.notifications.webhook import handle_inbound_message
-
-        req = self._make_request()
-        DeliveryRecord.objects.create(
-            hotel=self.hotel, request=req,
-            channel='WHATSAPP', target='919876543210',
-            event_type='request.created', status='SENT',
-        )
         handle_inbound_message({
             'payload': {
                 'source': '919876543210',
@@ -844,19 +854,11 @@ class WebhookTextFallbackTest(NotificationSetupMixin, TestCase):
                 'text': 'on it',
             },
         })
-        req.refresh_from_db()
-        self.assertEqual(req.status, 'ACKNOWLEDGED')
+        self.default_request.refresh_from_db()
+        self.assertEqual(self.default_request.status, 'ACKNOWLEDGED')
 
     def test_unrecognized_text_no_action(self):
         """Arbitrary text should not acknowledge any request."""
-        from concierge.notifications.webhook import handle_inbound_message
-
-        req = self._make_request()
-        DeliveryRecord.objects.create(
-            hotel=self.hotel, request=req,
-            channel='WHATSAPP', target='919876543210',
-            event_type='request.created', status='SENT',
-        )
         handle_inbound_message({
             'payload': {
                 'source': '919876543210',
@@ -864,13 +866,11 @@ class WebhookTextFallbackTest(NotificationSetupMixin, TestCase):
                 'text': 'hello there',
             },
         })
-        req.refresh_from_db()
-        self.assertEqual(req.status, 'CREATED')
+        self.default_request.refresh_from_db()
+        self.assertEqual(self.default_request.status, 'CREATED')
 
     def test_no_delivery_record_skips(self):
         """Text from phone with no delivery records should skip silently."""
-        from concierge.notifications.webhook import handle_inbound_message
-
         # Should not raise
         handle_inbound_message({
             'payload': {
@@ -882,16 +882,8 @@ class WebhookTextFallbackTest(NotificationSetupMixin, TestCase):
 
     def test_null_request_delivery_record_skipped(self):
         """DeliveryRecord with request=None should be skipped in fallback."""
-        from concierge.notifications.webhook import handle_inbound_message
-
-        req = self._make_request()
-        # Older valid record
-        DeliveryRecord.objects.create(
-            hotel=self.hotel, request=req,
-            channel='WHATSAPP', target='919876543210',
-            event_type='request.created', status='SENT',
-        )
-        # Newer record with no request (should be skipped by filter)
+        # Newer than the class-level record, but has no request
+        # (should be skipped by filter)
         DeliveryRecord.objects.create(
             hotel=self.hotel, request=None,
             channel='WHATSAPP', target='919876543210',
@@ -904,13 +896,11 @@ class WebhookTextFallbackTest(NotificationSetupMixin, TestCase):
                 'text': 'Acknowledge',
             },
         })
-        req.refresh_from_db()
-        self.assertEqual(req.status, 'ACKNOWLEDGED')
+        self.default_request.refresh_from_db()
+        self.assertEqual(self.default_request.status, 'ACKNOWLEDGED')
 
     def test_delivery_fallback_scoped_to_member_hotels(self):
         """Fallback should only match deliveries from hotels where phone is a member."""
-        from concierge.notifications.webhook import handle_inbound_message
-
         # Create a second hotel where staff_user is NOT a member
         other_hotel = Hotel.objects.create(name='Other Hotel', slug='other-hotel')
         other_dept = Department.objects.create(hotel=other_hotel, name='Bar', slug='bar')
@@ -918,19 +908,13 @@ class WebhookTextFallbackTest(NotificationSetupMixin, TestCase):
             hotel=other_hotel, guest_stay=self.stay,
             department=other_dept, request_type='BOOKING',
         )
-        # Delivery record on the OTHER hotel (newer)
+        # Delivery record on the OTHER hotel — newer than the class-level
+        # record on the member's hotel
         DeliveryRecord.objects.create(
             hotel=other_hotel, request=other_req,
             channel='WHATSAPP', target='919876543210',
             event_type='request.created', status='SENT',
         )
-        # Delivery record on member's hotel (older)
-        req = self._make_request()
-        DeliveryRecord.objects.create(
-            hotel=self.hotel, request=req,
-            channel='WHATSAPP', target='919876543210',
-            event_type='request.created', status='SENT',
-        )
 
         handle_inbound_message({
             'payload': {
@@ -940,8 +924,8 @@ class WebhookTextFallbackTest(NotificationSetupMixin, TestCase):
             },
         })
         # Should ack the member's hotel request, not the other hotel's
-        req.refresh_from_db()
-        self.assertEqual(req.status, 'ACKNOWLEDGED')
+        self.default_request.refresh_from_db()
+        self.assertEqual(self.default_request.status, 'ACKNOWLEDGED')
         other_req.refresh_from_db()
         self.assertEqual(other_req.status, 'CREATED')
 
@@ -950,6 +934,15 @@ class WebhookTextFallbackTest(NotificationSetupMixin, TestCase):
 # Celery tasks
 # ---------------------------------------------------------------------------
 
+# Shared by the WhatsApp task classes, which only vary hotel and message_type.
+_WA_RECORD_DEFAULTS = {
+    'channel': 'WHATSAPP',
+    'target': '919876543210',
+    'event_type': 'request.created',
+    'status': 'QUEUED',
+}
+
+
 @override_settings(
     GUPSHUP_WA_API_KEY='test-key',
     GUPSHUP_WA_SOURCE_PHONE='919187551736',
@@ -960,28 +953,21 @@ class WebhookTextFallbackTest(NotificationSetupMixin, TestCase):
 )
 class WhatsAppTemplateTaskTest(NotificationSetupMixin, TestCase):
 
-    def _make_record(self, event_type='request.created', **kwargs):
-        defaults = {
-            'hotel': self.hotel,
-            'channel': 'WHATSAPP',
-            'target': '919876543210',
-            'event_type': event_type,
-            'status': 'QUEUED',
-            'message_type': 'TEMPLATE',
-        }
-        defaults.update(kwargs)
-        return DeliveryRecord.objects.create(**defaults)
-
-    @patch('concierge.notifications.tasks.http_requests.post')
-    def test_template_send_success(self, mock_post):
-        from concierge.notifications.tasks import send_whatsapp_template_notification
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Every test flips this record to SENT/FAILED; the per-test
+        # transaction rollback restores it to QUEUED for the next one.
+        cls.record = DeliveryRecord.objects.create(
+            hotel=cls.hotel, message_type='TEMPLATE', **_WA_RECORD_DEFAULTS,
+        )
 
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {'status': 'submitted', 'messageId': 'gup-123'}
-        mock_post.return_value = mock_resp
+    def test_template_send_success(self):
+        self.mock_post.return_value = _gupshup_response(
+            200, {'status': 'submitted', 'messageId': 'gup-123'},
+        )
 
-        record = self._make_record()
+        record = self.record
         params = {
             'guest_name': 'Guest User', 'room_number': '101',
             'department': 'Spa', 'subject': 'Deep Tissue Massage',
@@ -990,21 +976,17 @@ class WhatsAppTemplateTaskTest(NotificationSetupMixin, TestCase):
 
         send_whatsapp_template_notification(record.id, params)
 
-        record.refresh_from_db()
-        self.assertEqual(record.status, 'SENT')
-        self.assertEqual(record.provider_message_id, 'gup-123')
+        reloaded = self._reload_record(record)
+        self.assertEqual(reloaded['status'], 'SENT')
+        self.assertEqual(reloaded['provider_message_id'], 'gup-123')
 
-    @patch('concierge.notifications.tasks.http_requests.post')
-    def test_template_send_provider_error_in_body(self, mock_post):
+    def test_template_send_provider_error_in_body(self):
         """200 with status=error in body should mark FAILED and NOT retry."""
-        from concierge.notifications.tasks import send_whatsapp_template_notification
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {'status': 'error', 'message': 'Invalid template'}
-        mock_post.return_value = mock_resp
+        self.mock_post.return_value = _gupshup_response(
+            200, {'status': 'error', 'message': 'Invalid template'},
+        )
 
-        record = self._make_record()
+        record = self.record
         params = {
             'guest_name': 'Guest', 'room_number': '101',
             'department': 'Spa', 'subject': 'Massage',
@@ -1014,21 +996,15 @@ class WhatsAppTemplateTaskTest(NotificationSetupMixin, TestCase):
         # Should NOT raise (ValueError is not in _TRANSIENT_ERRORS, so no retry)
         send_whatsapp_template_notification(record.id, params)
 
-        record.refresh_from_db()
-        self.assertEqual(record.status, 'FAILED')
-        self.assertIn('Gupshup API error', record.error_message)
+        reloaded = self._reload_record(record)
+        self.assertEqual(reloaded['status'], 'FAILED')
+        self.assertIn('Gupshup API error', reloaded['error_message'])
 
-    @patch('concierge.notifications.tasks.http_requests.post')
-    def test_template_send_5xx_retries(self, mock_post):
+    def test_template_send_5xx_retries(self):
         """5xx triggers RuntimeError which is retryable (raises Retry in test)."""
-        from celery.exceptions import Retry
-        from concierge.notifications.tasks import send_whatsapp_template_notification
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 500
-        mock_post.return_value = mock_resp
+        self.mock_post.return_value = _gupshup_response(500)
 
-        record = self._make_record()
+        record = self.record
         params = {
             'guest_name': 'Guest', 'room_number': '101',
             'department': 'Spa', 'subject': 'Massage',
@@ -1038,18 +1014,14 @@ class WhatsAppTemplateTaskTest(NotificationSetupMixin, TestCase):
         with self.assertRaises(RuntimeError):
             send_whatsapp_template_notification(record.id, params)
 
-        record.refresh_from_db()
-        self.assertEqual(record.status, 'FAILED')
+        reloaded = self._reload_record(record)
+        self.assertEqual(reloaded['status'], 'FAILED')
 
-    @patch('concierge.notifications.tasks.http_requests.post')
-    def test_connection_error_retries(self, mock_post):
+    def test_connection_error_retries(self):
         """requests.exceptions.ConnectionError should trigger retry."""
-        import requests as http_requests
-        from concierge.notifications.tasks import send_whatsapp_template_notification
-
-        mock_post.side_effect = http_requests.exceptions.ConnectionError('timeout')
+        self.mock_post.side_effect = http_requests.exceptions.ConnectionError('timeout')
 
-        record = self._make_record()
+        record = self.record
         params = {
             'guest_name': 'Guest', 'room_number': '101',
             'department': 'Spa', 'subject': 'Massage',
@@ -1059,9 +1031,9 @@ class WhatsAppTemplateTaskTest(NotificationSetupMixin, TestCase):
         with self.assertRaises(http_requests.exceptions.ConnectionError):
             send_whatsapp_template_notification(record.id, params)
 
-        record.refresh_from_db()
-        self.assertEqual(record.status, 'FAILED')
-        self.assertIn('timeout', record.error_message)
+        reloaded = self._reload_record(record)
+        self.assertEqual(reloaded['status'], 'FAILED')
+        self.assertIn('timeout', reloaded['error_message'])
 
 
 @override_settings(
@@ -1072,28 +1044,21 @@ class WhatsAppTemplateTaskTest(NotificationSetupMixin, TestCase):
 )
 class WhatsAppSessionTaskTest(NotificationSetupMixin, TestCase):
 
-    def _make_record(self, **kwargs):
-        defaults = {
-            'hotel': self.hotel,
-            'channel': 'WHATSAPP',
-            'target': '919876543210',
-            'event_type': 'request.created',
-            'status': 'QUEUED',
-            'message_type': 'SESSION',
-        }
-        defaults.update(kwargs)
-        return DeliveryRecord.objects.create(**defaults)
-
-    @patch('concierge.notifications.tasks.http_requests.post')
-    def test_session_send_success(self, mock_post):
-        from concierge.notifications.tasks import send_whatsapp_session_notification
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Every test flips this record to SENT/FAILED; the per-test
+        # transaction rollback restores it to QUEUED for the next one.
+        cls.record = DeliveryRecord.objects.create(
+            hotel=cls.hotel, message_type='SESSION', **_WA_RECORD_DEFAULTS,
+        )
 
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {'status': 'submitted', 'messageId': 'gup-456'}
-        mock_post.return_value = mock_resp
+    def test_session_send_success(self):
+        self.mock_post.return_value = _gupshup_response(
+            200, {'status': 'submitted', 'messageId': 'gup-456'},
+        )
 
-        record = self._make_record()
+        record = self.record
         params = {
             'guest_name': 'Guest User', 'room_number': '101',
             'department': 'Spa', 'subject': 'Deep Tissue',
@@ -1102,24 +1067,19 @@ class WhatsAppSessionTaskTest(NotificationSetupMixin, TestCase):
 
         send_whatsapp_session_notification(record.id, params)
 
-        record.refresh_from_db()
-        self.assertEqual(record.status, 'SENT')
-        self.assertEqual(record.provider_message_id, 'gup-456')
+        reloaded = self._reload_record(record)
+        self.assertEqual(reloaded['status'], 'SENT')
+        self.assertEqual(reloaded['provider_message_id'], 'gup-456')
 
-    @patch('concierge.notifications.tasks.send_whatsapp_template_notification.delay')
-    @patch('concierge.notifications.tasks.http_requests.post')
-    def test_session_expired_falls_back_to_template(self, mock_post, mock_template_delay):
-        from concierge.notifications.tasks import send_whatsapp_session_notification
+    def test_session_expired_falls_back_to_template(self):
+        mock_template_delay = _DELAY_MOCKS['send_whatsapp_template_notification']
 
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {
+        self.mock_post.return_value = _gupshup_response(200, {
             'status': 'error',
             'message': '24 hours have passed since customer last replied',
-        }
-        mock_post.return_value = mock_resp
+        })
 
-        record = self._make_record()
+        record = self.record
         params = {
             'guest_name': 'Guest', 'room_number': '101',
             'department': 'Spa', 'subject': 'Massage',
@@ -1128,8 +1088,8 @@ class WhatsAppSessionTaskTest(NotificationSetupMixin, TestCase):
 
         send_whatsapp_session_notification(record.id, params)
 
-        record.refresh_from_db()
-        self.assertEqual(record.message_type, 'TEMPLATE')
+        reloaded = self._reload_record(record)
+        self.assertEqual(reloaded['message_type'], 'TEMPLATE')
         # Status still QUEUED (template task will update it)
         mock_template_delay.assert_called_once_with(record.id, params)
 
@@ -1140,10 +1100,12 @@ class WhatsAppSessionTaskTest(NotificationSetupMixin, TestCase):
 
 class NotificationRouteAPITest(NotificationSetupMixin, TestCase):
 
+    client_class = APIClient
+    base_url = '/api/v1/hotels/test-hotel/admin/notification-routes/'
+
     def setUp(self):
-        self.client = APIClient()
+        super().setUp()
         self.client.force_authenticate(self.admin_user)
-        self.base_url = '/api/v1/hotels/test-hotel/admin/notification-routes/'
 
     def test_list_returns_array_not_paginated(self):
         """Ensure the response is a plain array (pagination_class = None)."""
@@ -1290,17 +1252,15 @@ class NotificationRouteAPITest(NotificationSetupMixin, TestCase):
 class WhatsAppTaskHTTPStatusTest(NotificationSetupMixin, TestCase):
     """Tests for HTTP status branching in WhatsApp tasks."""
 
-    def _make_record(self, message_type='TEMPLATE', **kwargs):
-        defaults = {
-            'hotel': self.hotel,
-            'channel': 'WHATSAPP',
-            'target': '919876543210',
-            'event_type': 'request.created',
-            'status': 'QUEUED',
-            'message_type': message_type,
-        }
-        defaults.update(kwargs)
-        return DeliveryRecord.objects.create(**defaults)
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.template_record, cls.session_record = DeliveryRecord.objects.bulk_create([
+            DeliveryRecord(
+                hotel=cls.hotel, message_type=message_type, **_WA_RECORD_DEFAULTS,
+            )
+            for message_type in ('TEMPLATE', 'SESSION')
+        ])
 
     def _params(self):
         return {
@@ -1309,74 +1269,52 @@ class WhatsAppTaskHTTPStatusTest(NotificationSetupMixin, TestCase):
             'public_id': str(uuid.uuid4()),
         }
 
-    @patch('concierge.notifications.tasks.http_requests.post')
-    def test_template_429_retries(self, mock_post):
+    def test_template_429_retries(self):
         """429 Too Many Requests should trigger retry (transient)."""
-        from concierge.notifications.tasks import send_whatsapp_template_notification
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 429
-        mock_post.return_value = mock_resp
+        self.mock_post.return_value = _gupshup_response(429)
 
-        record = self._make_record()
+        record = self.template_record
         with self.assertRaises(RuntimeError):
             send_whatsapp_template_notification(record.id, self._params())
 
-        record.refresh_from_db()
-        self.assertEqual(record.status, 'FAILED')
+        reloaded = self._reload_record(record)
+        self.assertEqual(reloaded['status'], 'FAILED')
 
-    @patch('concierge.notifications.tasks.http_requests.post')
-    def test_template_401_fails_no_retry(self, mock_post):
+    def test_template_401_fails_no_retry(self):
         """401 Unauthorized should fail permanently (ValueError, not retried)."""
-        from concierge.notifications.tasks import send_whatsapp_template_notification
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 401
-        mock_resp.text = 'Unauthorized'
-        mock_post.return_value = mock_resp
+        self.mock_post.return_value = _gupshup_response(401, text='Unauthorized')
 
-        record = self._make_record()
+        record = self.template_record
         # Should NOT raise (ValueError not in _TRANSIENT_ERRORS)
         send_whatsapp_template_notification(record.id, self._params())
 
-        record.refresh_from_db()
-        self.assertEqual(record.status, 'FAILED')
-        self.assertIn('401', record.error_message)
+        reloaded = self._reload_record(record)
+        self.assertEqual(reloaded['status'], 'FAILED')
+        self.assertIn('401', reloaded['error_message'])
 
-    @patch('concierge.notifications.tasks.http_requests.post')
-    def test_template_missing_message_id_fails(self, mock_post):
+    def test_template_missing_message_id_fails(self):
         """200 with no messageId in body should fail."""
-        from concierge.notifications.tasks import send_whatsapp_template_notification
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {'status': 'submitted'}  # No messageId
-        mock_post.return_value = mock_resp
+        # No messageId
+        self.mock_post.return_value = _gupshup_response(200, {'status': 'submitted'})
 
-        record = self._make_record()
+        record = self.template_record
         send_whatsapp_template_notification(record.id, self._params())
 
-        record.refresh_from_db()
-        self.assertEqual(record.status, 'FAILED')
-        self.assertIn('messageId', record.error_message)
+        reloaded = self._reload_record(record)
+        self.assertEqual(reloaded['status'], 'FAILED')
+        self.assertIn('messageId', reloaded['error_message'])
 
-    @patch('concierge.notifications.tasks.http_requests.post')
-    def test_session_401_fails_no_fallback(self, mock_post):
+    def test_session_401_fails_no_fallback(self):
         """Session send with 401 should fail, NOT fall back to template."""
-        from concierge.notifications.tasks import send_whatsapp_session_notification
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 401
-        mock_resp.text = 'Unauthorized'
-        mock_post.return_value = mock_resp
+        self.mock_post.return_value = _gupshup_response(401, text='Unauthorized')
 
-        record = self._make_record(message_type='SESSION')
+        record = self.session_record
         send_whatsapp_session_notification(record.id, self._params())
 
-        record.refresh_from_db()
-        self.assertEqual(record.status, 'FAILED')
-        self.assertEqual(record.message_type, 'SESSION')  # NOT changed to TEMPLATE
-        self.assertIn('401', record.error_message)
+        reloaded = self._reload_record(record)
+        self.assertEqual(reloaded['status'], 'FAILED')
+        self.assertEqual(reloaded['message_type'], 'SESSION')  # NOT changed to TEMPLATE
+        self.assertIn('401', reloaded['error_message'])
 
 
 # ---------------------------------------------------------------------------
@@ -1386,14 +1324,13 @@ class WhatsAppTaskHTTPStatusTest(NotificationSetupMixin, TestCase):
 @override_settings(RESEND_API_KEY='test-resend-key')
 class EmailAdapterEnabledTest(NotificationSetupMixin, TestCase):
 
-    def setUp(self):
-        self.adapter = EmailAdapter()
-        self.hotel.email_notifications_enabled = True
-        self.hotel.save(update_fields=['email_notifications_enabled'])
+    adapter = EmailAdapter()
 
-    def tearDown(self):
-        self.hotel.email_notifications_enabled = False
-        self.hotel.save(update_fields=['email_notifications_enabled'])
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.hotel.email_notifications_enabled = True
+        Hotel.objects.filter(pk=cls.hotel.pk).update(email_notifications_enabled=True)
 
     def test_enabled_when_hotel_flag_and_api_key(self):
         self.assertTrue(self.adapter.is_enabled(self.hotel))
@@ -1422,20 +1359,19 @@ class EmailAdapterEnabledTest(NotificationSetupMixin, TestCase):
 @override_settings(RESEND_API_KEY='test-resend-key')
 class EmailAdapterRoutingTest(NotificationSetupMixin, TestCase):
 
-    def setUp(self):
-        self.adapter = EmailAdapter()
-        self.hotel.email_notifications_enabled = True
-        self.hotel.save(update_fields=['email_notifications_enabled'])
-        self.route = NotificationRoute.objects.create(
-            hotel=self.hotel, department=self.dept,
+    adapter = EmailAdapter()
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.hotel.email_notifications_enabled = True
+        Hotel.objects.filter(pk=cls.hotel.pk).update(email_notifications_enabled=True)
+        cls.route = NotificationRoute.objects.create(
+            hotel=cls.hotel, department=cls.dept,
             channel='EMAIL', target='staff@hotel.com',
-            label='Staff Email', created_by=self.admin_user,
+            label='Staff Email', created_by=cls.admin_user,
         )
 
-    def tearDown(self):
-        self.hotel.email_notifications_enabled = False
-        self.hotel.save(update_fields=['email_notifications_enabled'])
-
     def test_routes_to_department_wide_route(self):
         event = self._make_event()
         recipients = self.adapter.get_recipients(event)
@@ -1472,13 +1408,10 @@ class EmailAdapterRoutingTest(NotificationSetupMixin, TestCase):
         self.assertEqual(targets.count('staff@hotel.com'), 1)
 
     def test_inactive_routes_excluded(self):
-        self.route.is_active = False
-        self.route.save()
+        NotificationRoute.objects.filter(pk=self.route.pk).update(is_active=False)
         event = self._make_event()
         recipients = self.adapter.get_recipients(event)
         self.assertEqual(len(recipients), 0)
-        self.route.is_active = True
-        self.route.save()
 
     def test_ignores_whatsapp_routes(self):
         """EMAIL adapter should not pick up WHATSAPP routes."""
@@ -1504,22 +1437,21 @@ class EmailAdapterRoutingTest(NotificationSetupMixin, TestCase):
 )
 class EmailAdapterSendTest(NotificationSetupMixin, TestCase):
 
-    def setUp(self):
-        self.adapter = EmailAdapter()
-        self.hotel.email_notifications_enabled = True
-        self.hotel.save(update_fields=['email_notifications_enabled'])
-        self.route = NotificationRoute.objects.create(
-            hotel=self.hotel, department=self.dept,
+    adapter = EmailAdapter()
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.hotel.email_notifications_enabled = True
+        Hotel.objects.filter(pk=cls.hotel.pk).update(email_notifications_enabled=True)
+        cls.route = NotificationRoute.objects.create(
+            hotel=cls.hotel, department=cls.dept,
             channel='EMAIL', target='staff@hotel.com',
-            label='Staff Email', created_by=self.admin_user,
+            label='Staff Email', created_by=cls.admin_user,
         )
 
-    def tearDown(self):
-        self.hotel.email_notifications_enabled = False
-        self.hotel.save(update_fields=['email_notifications_enabled'])
-
-    @patch('concierge.notifications.tasks.send_email_notification.delay')
-    def test_send_creates_delivery_record_and_queues_task(self, mock_delay):
+    def test_send_creates_delivery_record_and_queues_task(self):
+        mock_delay = _DELAY_MOCKS['send_email_notification']
         event = self._make_event()
         record = self.adapter.send(self.route, event)
 
@@ -1529,8 +1461,8 @@ class EmailAdapterSendTest(NotificationSetupMixin, TestCase):
         self.assertEqual(record.status, 'QUEUED')
         mock_delay.assert_called_once()
 
-    @patch('concierge.notifications.tasks.send_email_notification.delay')
-    def test_idempotency_prevents_duplicate(self, mock_delay):
+    def test_idempotency_prevents_duplicate(self):
+        mock_delay = _DELAY_MOCKS['send_email_notification']
         event = self._make_event()
         record1 = self.adapter.send(self.route, event)
         record2 = self.adapter.send(self.route, event)
@@ -1539,8 +1471,27 @@ class EmailAdapterSendTest(NotificationSetupMixin, TestCase):
         # Task queued only once
         self.assertEqual(mock_delay.call_count, 1)
 
-    @patch('concierge.notifications.tasks.send_email_notification.delay')
-    def test_params_include_hotel_and_request_info(self, mock_delay):
+    def test_send_many_only_queues_new_records(self):
+        mock_delay = _DELAY_MOCKS['send_email_notification']
+        second = NotificationRoute.objects.create(
+            hotel=self.hotel, department=self.dept,
+            channel='EMAIL', target='ops@hotel.com',
+            label='Ops Email', created_by=self.admin_user,
+        )
+        event = self._make_event()
+        existing = self.adapter.send(self.route, event)
+        mock_delay.reset_mock()
+
+        self.adapter.send_many([self.route, second], event)
+
+        records = DeliveryRecord.objects.filter(request=event.request, channel='EMAIL')
+        self.assertEqual(records.count(), 2)
+        self.assertTrue(records.filter(pk=existing.pk).exists())
+        mock_delay.assert_called_once()
+        self.assertEqual(mock_delay.call_args[0][0], records.get(route=second).id)
+
+    def test_params_include_hotel_and_request_info(self):
+        mock_delay = _DELAY_MOCKS['send_email_notification']
         event = self._make_event()
         self.adapter.send(self.route, event)
 
@@ -1552,8 +1503,8 @@ class EmailAdapterSendTest(NotificationSetupMixin, TestCase):
         self.assertEqual(params['department'], 'Spa')
         self.assertEqual(params['event_type'], 'request.created')
 
-    @patch('concierge.notifications.tasks.send_email_notification.delay')
-    def test_after_hours_uses_original_dept_name(self, mock_delay):
+    def test_after_hours_uses_original_dept_name(self):
+        mock_delay = _DELAY_MOCKS['send_email_notification']
         event = self._make_event(
             event_type='after_hours_fallback',
             extra={'original_department_name': 'Pool Bar'},
@@ -1578,22 +1529,20 @@ class EmailAdapterSendTest(NotificationSetupMixin, TestCase):
 class CrossChannelIdempotencyTest(NotificationSetupMixin, TestCase):
     """Ensure WA and Email adapters never suppress each other via key collision."""
 
-    def setUp(self):
-        self.hotel.whatsapp_notifications_enabled = True
-        self.hotel.email_notifications_enabled = True
-        self.hotel.save(update_fields=['whatsapp_notifications_enabled', 'email_notifications_enabled'])
-
-    def tearDown(self):
-        self.hotel.email_notifications_enabled = False
-        self.hotel.save(update_fields=['email_notifications_enabled'])
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.hotel.whatsapp_notifications_enabled = True
+        cls.hotel.email_notifications_enabled = True
+        Hotel.objects.filter(pk=cls.hotel.pk).update(
+            whatsapp_notifications_enabled=True, email_notifications_enabled=True,
+        )
 
-    @patch('concierge.notifications.tasks.send_email_notification.delay')
-    @patch('concierge.notifications.tasks.send_whatsapp_template_notification.delay')
-    def test_same_route_id_different_channels_both_create_records(
-        self, mock_wa_delay, mock_email_delay,
-    ):
+    def test_same_route_id_different_channels_both_create_records(self):
         """Even if a WA route and EMAIL route have the same DB id,
         both adapters must create independent DeliveryRecords."""
+        mock_email_delay = _DELAY_MOCKS['send_email_notification']
+        mock_wa_delay = _DELAY_MOCKS['send_whatsapp_template_notification']
         wa_route = NotificationRoute.objects.create(
             hotel=self.hotel, department=self.dept,
             channel='WHATSAPP', target='919876543210',
@@ -1635,17 +1584,24 @@ class CrossChannelIdempotencyTest(NotificationSetupMixin, TestCase):
 )
 class EmailTaskTest(NotificationSetupMixin, TestCase):
 
-    def _make_record(self):
-        req = self._make_request()
-        return DeliveryRecord.objects.create(
-            hotel=self.hotel,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Every test flips this record to SENT/FAILED; the per-test
+        # transaction rollback restores it to QUEUED for the next one.
+        req = ServiceRequest.objects.create(
+            hotel=cls.hotel, guest_stay=cls.stay,
+            department=cls.dept, request_type='BOOKING',
+        )
+        cls.record = DeliveryRecord.objects.create(
+            hotel=cls.hotel,
             request=req,
             channel='EMAIL',
             target='staff@hotel.com',
             event_type='request.created',
             status='QUEUED',
             message_type='TEMPLATE',
-            idempotency_key=f'email:request.created:{req.public_id}:0:test-{uuid.uuid4().hex[:8]}',
+            idempotency_key=f'email:request.created:{req.public_id}:0:test',
         )
 
     def _params(self):
@@ -1662,104 +1618,84 @@ class EmailTaskTest(NotificationSetupMixin, TestCase):
             'escalation_tier': None,
         }
 
-    @patch('resend.Emails.send')
-    def test_send_success(self, mock_send):
-        mock_send.return_value = {'id': 'email-abc-123'}
+    def test_send_success(self):
+        self.mock_send.return_value = {'id': 'email-abc-123'}
 
-        record = self._make_record()
-        from concierge.notifications.tasks import send_email_notification
+        record = self.record
         send_email_notification(record.id, self._params())
 
-        record.refresh_from_db()
-        self.assertEqual(record.status, 'SENT')
-        self.assertEqual(record.provider_message_id, 'email-abc-123')
-        mock_send.assert_called_once()
+        reloaded = self._reload_record(record)
+        self.assertEqual(reloaded['status'], 'SENT')
+        self.assertEqual(reloaded['provider_message_id'], 'email-abc-123')
+        self.mock_send.assert_called_once()
 
         # Verify email params
-        call_kwargs = mock_send.call_args[0][0]
+        call_kwargs = self.mock_send.call_args[0][0]
         self.assertEqual(call_kwargs['to'], ['staff@hotel.com'])
         self.assertIn('New Request', call_kwargs['subject'])
 
-    @patch('resend.Emails.send')
-    def test_permanent_validation_error_no_retry(self, mock_send):
-        from resend.exceptions import ValidationError
-        mock_send.side_effect = ValidationError('invalid email', 400, 'validation_error')
+    def test_permanent_validation_error_no_retry(self):
+        self.mock_send.side_effect = ValidationError('invalid email', 400, 'validation_error')
 
-        record = self._make_record()
-        from concierge.notifications.tasks import send_email_notification
+        record = self.record
         # Should NOT raise — permanent errors are caught
         send_email_notification(record.id, self._params())
 
-        record.refresh_from_db()
-        self.assertEqual(record.status, 'FAILED')
-        self.assertIn('invalid email', record.error_message)
+        reloaded = self._reload_record(record)
+        self.assertEqual(reloaded['status'], 'FAILED')
+        self.assertIn('invalid email', reloaded['error_message'])
 
-    @patch('resend.Emails.send')
-    def test_permanent_missing_api_key_no_retry(self, mock_send):
-        from resend.exceptions import MissingApiKeyError
-        mock_send.side_effect = MissingApiKeyError('missing key', 401, 'missing_api_key')
+    def test_permanent_missing_api_key_no_retry(self):
+        self.mock_send.side_effect = MissingApiKeyError('missing key', 401, 'missing_api_key')
 
-        record = self._make_record()
-        from concierge.notifications.tasks import send_email_notification
+        record = self.record
         send_email_notification(record.id, self._params())
 
-        record.refresh_from_db()
-        self.assertEqual(record.status, 'FAILED')
+        reloaded = self._reload_record(record)
+        self.assertEqual(reloaded['status'], 'FAILED')
 
-    @patch('resend.Emails.send')
-    def test_rate_limit_retries(self, mock_send):
-        from resend.exceptions import RateLimitError
-        mock_send.side_effect = RateLimitError('rate limited', 429, 'rate_limit_exceeded')
-
-        record = self._make_record()
-        from concierge.notifications.tasks import send_email_notification
+    def test_rate_limit_retries(self):
+        self.mock_send.side_effect = RateLimitError('rate limited', 429, 'rate_limit_exceeded')
 
+        record = self.record
         with self.assertRaises(RateLimitError):
             send_email_notification(record.id, self._params())
 
-        record.refresh_from_db()
-        self.assertEqual(record.status, 'FAILED')
-
-    @patch('resend.Emails.send')
-    def test_application_error_retries(self, mock_send):
-        from resend.exceptions import ApplicationError
-        mock_send.side_effect = ApplicationError('server error', 500, 'application_error')
+        reloaded = self._reload_record(record)
+        self.assertEqual(reloaded['status'], 'FAILED')
 
-        record = self._make_record()
-        from concierge.notifications.tasks import send_email_notification
+    def test_application_error_retries(self):
+        self.mock_send.side_effect = ApplicationError('server error', 500, 'application_error')
 
+        record = self.record
         with self.assertRaises(ApplicationError):
             send_email_notification(record.id, self._params())
 
-        record.refresh_from_db()
-        self.assertEqual(record.status, 'FAILED')
+        reloaded = self._reload_record(record)
+        self.assertEqual(reloaded['status'], 'FAILED')
 
-    @patch('resend.Emails.send')
-    def test_escalation_email_subject(self, mock_send):
-        mock_send.return_value = {'id': 'email-esc-123'}
+    def test_escalation_email_subject(self):
+        self.mock_send.return_value = {'id': 'email-esc-123'}
 
-        record = self._make_record()
+        record = self.record
         params = self._params()
         params['event_type'] = 'escalation'
         params['escalation_tier'] = 2
 
-        from concierge.notifications.tasks import send_email_notification
         send_email_notification(record.id, params)
 
-        call_kwargs = mock_send.call_args[0][0]
+        call_kwargs = self.mock_send.call_args[0][0]
         self.assertIn('Escalation', call_kwargs['subject'])
 
-    @patch('resend.Emails.send')
-    def test_email_html_contains_dashboard_link(self, mock_send):
-        mock_send.return_value = {'id': 'email-link-123'}
+    def test_email_html_contains_dashboard_link(self):
+        self.mock_send.return_value = {'id': 'email-link-123'}
 
-        record = self._make_record()
+        record = self.record
         params = self._params()
 
-        from concierge.notifications.tasks import send_email_notification
         send_email_notification(record.id, params)
 
-        call_kwargs = mock_send.call_args[0][0]
+        call_kwargs = self.mock_send.call_args[0][0]
         self.assertIn(f'/dashboard/requests/{params["public_id"]}', call_kwargs['html'])
 
 
@@ -1771,8 +1707,8 @@ class EventRoutingSetupMixin(NotificationSetupMixin):
     """Extends shared setup with an Event + event-scoped routes."""
 
     @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
+    def setUpTestData(cls):
+        super().setUpTestData()
         cls.event = Event.objects.create(
             hotel=cls.hotel,
             department=cls.dept,
@@ -1785,10 +1721,12 @@ class EventRoutingSetupMixin(NotificationSetupMixin):
 class EventRouteAPITest(EventRoutingSetupMixin, TestCase):
     """CRUD and filtering for event-scoped notification routes."""
 
+    client_class = APIClient
+    base_url = '/api/v1/hotels/test-hotel/admin/notification-routes/'
+
     def setUp(self):
-        self.client = APIClient()
+        super().setUp()
         self.client.force_authenticate(self.admin_user)
-        self.base_url = '/api/v1/hotels/test-hotel/admin/notification-routes/'
 
     def test_create_event_route(self):
         resp = self.client.post(self.base_url, {
@@ -1907,17 +1845,16 @@ class EventRouteAPITest(EventRoutingSetupMixin, TestCase):
 class EventRoutePushTest(EventRoutingSetupMixin, TestCase):
     """PushAdapter respects notify_department toggle."""
 
-    def setUp(self):
-        self.adapter = PushAdapter()
+    adapter = PushAdapter()
 
     def test_notify_dept_true_includes_dept_staff(self):
         """Default notify_department=True → dept staff + admins."""
         self.event.notify_department = True
-        self.event.save(update_fields=['notify_department'])
+        Event.objects.filter(pk=self.event.pk).update(notify_department=True)
         req = self._make_request(event=self.event)
         event = self._make_event(request=req, event_obj=self.event)
         recipients = self.adapter.get_recipients(event)
-        user_ids = {m.user_id for m in recipients}
+        user_ids = [m.user_id for m in recipients]
         self.assertIn(self.staff_user.id, user_ids)
         self.assertIn(self.admin_user.id, user_ids)
         self.assertIn(self.superadmin_user.id, user_ids)
@@ -1925,11 +1862,11 @@ class EventRoutePushTest(EventRoutingSetupMixin, TestCase):
     def test_notify_dept_false_excludes_dept_staff(self):
         """notify_department=False → admins only, no dept staff."""
         self.event.notify_department = False
-        self.event.save(update_fields=['notify_department'])
+        Event.objects.filter(pk=self.event.pk).update(notify_department=False)
         req = self._make_request(event=self.event)
         event = self._make_event(request=req, event_obj=self.event)
         recipients = self.adapter.get_recipients(event)
-        user_ids = {m.user_id for m in recipients}
+        user_ids = [m.user_id for m in recipients]
         self.assertNotIn(self.staff_user.id, user_ids)
         self.assertIn(self.admin_user.id, user_ids)
         self.assertIn(self.superadmin_user.id, user_ids)
@@ -1938,34 +1875,39 @@ class EventRoutePushTest(EventRoutingSetupMixin, TestCase):
 class EventRouteWhatsAppTest(EventRoutingSetupMixin, TestCase):
     """WhatsAppAdapter routes with event-scoped + dept-scoped routes."""
 
-    def setUp(self):
-        self.adapter = WhatsAppAdapter()
+    adapter = WhatsAppAdapter()
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
         # Department-wide WA route
-        self.dept_route = NotificationRoute.objects.create(
-            hotel=self.hotel, department=self.dept,
+        cls.dept_route = NotificationRoute.objects.create(
+            hotel=cls.hotel, department=cls.dept,
             channel='WHATSAPP', target='919876543210',
-            label='Dept Staff', created_by=self.admin_user,
+            label='Dept Staff', created_by=cls.admin_user,
         )
         # Event-specific WA route
-        self.event_route = NotificationRoute.objects.create(
-            hotel=self.hotel, event=self.event,
+        cls.event_route = NotificationRoute.objects.create(
+            hotel=cls.hotel, event=cls.event,
             channel='WHATSAPP', target='919111222333',
-            label='Sommelier', created_by=self.admin_user,
+            label='Sommelier', created_by=cls.admin_user,
         )
 
     def test_both_routes_when_notify_dept_true(self):
         self.event.notify_department = True
-        self.event.save(update_fields=['notify_department'])
+        Event.objects.filter(pk=self.event.pk).update(notify_department=True)
         req = self._make_request(event=self.event)
         event = self._make_event(request=req, event_obj=self.event)
-        recipients = self.adapter.get_recipients(event)
+        # Dept + event scopes are OR-ed into a single route query
+        with self.assertNumQueries(1):
+            recipients = self.adapter.get_recipients(event)
         targets = {r.target for r in recipients}
         self.assertIn('919876543210', targets)
         self.assertIn('919111222333', targets)
 
     def test_only_event_routes_when_notify_dept_false(self):
         self.event.notify_department = False
-        self.event.save(update_fields=['notify_department'])
+        Event.objects.filter(pk=self.event.pk).update(notify_department=False)
         req = self._make_request(event=self.event)
         event = self._make_event(request=req, event_obj=self.event)
         recipients = self.adapter.get_recipients(event)
@@ -1978,48 +1920,61 @@ class EventRouteWhatsAppTest(EventRoutingSetupMixin, TestCase):
         self.event_route.target = '919876543210'
         self.event_route.save()
         self.event.notify_department = True
-        self.event.save(update_fields=['notify_department'])
+        Event.objects.filter(pk=self.event.pk).update(notify_department=True)
         req = self._make_request(event=self.event)
         event = self._make_event(request=req, event_obj=self.event)
         recipients = self.adapter.get_recipients(event)
         targets = [r.target for r in recipients]
         self.assertEqual(targets.count('919876543210'), 1)
 
+    def test_params_for_event_request_need_no_queries(self):
+        req = self._make_request(event=self.event)
+        event = self._make_event(request=req, event_obj=self.event)
+        with self.assertNumQueries(0):
+            params = self.adapter._build_params(event)
+        self.assertEqual(params['subject'], 'Wine Tasting')
+        self.assertEqual(params['room_number'], '101')
+
 
 @override_settings(RESEND_API_KEY='re_test')
 class EventRouteEmailTest(EventRoutingSetupMixin, TestCase):
     """EmailAdapter routes with event-scoped + dept-scoped routes."""
 
-    def setUp(self):
-        self.adapter = EmailAdapter()
-        self.hotel.email_notifications_enabled = True
-        self.hotel.save(update_fields=['email_notifications_enabled'])
+    adapter = EmailAdapter()
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
         # Department-wide email route
-        self.dept_route = NotificationRoute.objects.create(
-            hotel=self.hotel, department=self.dept,
+        cls.dept_route = NotificationRoute.objects.create(
+            hotel=cls.hotel, department=cls.dept,
             channel='EMAIL', target='dept@hotel.com',
-            label='Dept Manager', created_by=self.admin_user,
+            label='Dept Manager', created_by=cls.admin_user,
         )
         # Event-specific email route
-        self.event_route = NotificationRoute.objects.create(
-            hotel=self.hotel, event=self.event,
+        cls.event_route = NotificationRoute.objects.create(
+            hotel=cls.hotel, event=cls.event,
             channel='EMAIL', target='event@hotel.com',
-            label='Event Coord', created_by=self.admin_user,
+            label='Event Coord', created_by=cls.admin_user,
         )
+        cls.hotel.email_notifications_enabled = True
+        Hotel.objects.filter(pk=cls.hotel.pk).update(email_notifications_enabled=True)
 
     def test_both_routes_when_notify_dept_true(self):
         self.event.notify_department = True
-        self.event.save(update_fields=['notify_department'])
+        Event.objects.filter(pk=self.event.pk).update(notify_department=True)
         req = self._make_request(event=self.event)
         event = self._make_event(request=req, event_obj=self.event)
-        recipients = self.adapter.get_recipients(event)
+        # Dept + event scopes are OR-ed into a single route query
+        with self.assertNumQueries(1):
+            recipients = self.adapter.get_recipients(event)
         targets = {r.target for r in recipients}
         self.assertIn('dept@hotel.com', targets)
         self.assertIn('event@hotel.com', targets)
 
     def test_only_event_routes_when_notify_dept_false(self):
         self.event.notify_department = False
-        self.event.save(update_fields=['notify_department'])
+        Event.objects.filter(pk=self.event.pk).update(notify_department=False)
         req = self._make_request(event=self.event)
         event = self._make_event(request=req, event_obj=self.event)
         recipients = self.adapter.get_recipients(event)
@@ -2047,54 +2002,54 @@ from concierge.notifications.oncall import OncallAdapter, OncallTarget
 class OncallAdapterEnabledTest(NotificationSetupMixin, TestCase):
     """is_enabled() checks escalation_fallback_channel + contact info."""
 
-    def setUp(self):
-        self.adapter = OncallAdapter()
-
-    def test_disabled_when_channel_none(self):
-        self.hotel.escalation_fallback_channel = 'NONE'
-        self.hotel.oncall_email = 'oncall@hotel.com'
-        self.hotel.save(update_fields=['escalation_fallback_channel', 'oncall_email'])
-        self.assertFalse(self.adapter.is_enabled(self.hotel))
-
-    def test_disabled_when_no_contacts(self):
-        self.hotel.escalation_fallback_channel = 'EMAIL'
-        self.hotel.oncall_email = ''
-        self.hotel.oncall_phone = ''
-        self.hotel.save(update_fields=['escalation_fallback_channel', 'oncall_email', 'oncall_phone'])
-        self.assertFalse(self.adapter.is_enabled(self.hotel))
-
-    def test_enabled_with_email_channel_and_email(self):
-        self.hotel.escalation_fallback_channel = 'EMAIL'
-        self.hotel.oncall_email = 'oncall@hotel.com'
-        self.hotel.save(update_fields=['escalation_fallback_channel', 'oncall_email'])
-        self.assertTrue(self.adapter.is_enabled(self.hotel))
-
-    def test_enabled_with_whatsapp_channel_and_phone(self):
-        self.hotel.escalation_fallback_channel = 'WHATSAPP'
-        self.hotel.oncall_phone = '+919999999999'
-        self.hotel.save(update_fields=['escalation_fallback_channel', 'oncall_phone'])
-        self.assertTrue(self.adapter.is_enabled(self.hotel))
-
-    def test_enabled_with_both_channel_and_only_email(self):
-        """EMAIL_WHATSAPP with only email set — still enabled."""
-        self.hotel.escalation_fallback_channel = 'EMAIL_WHATSAPP'
-        self.hotel.oncall_email = 'oncall@hotel.com'
-        self.hotel.oncall_phone = ''
-        self.hotel.save(update_fields=['escalation_fallback_channel', 'oncall_email', 'oncall_phone'])
-        self.assertTrue(self.adapter.is_enabled(self.hotel))
+    adapter = OncallAdapter()
+
+    def test_is_enabled_matrix(self):
+        """is_enabled() reads the in-memory hotel, so no save is needed per case."""
+        cases = [
+            # (name, channel, oncall_email, oncall_phone, expected)
+            ('channel_none', 'NONE', 'oncall@hotel.com', '', False),
+            ('no_contacts', 'EMAIL', '', '', False),
+            ('email_channel_and_email', 'EMAIL', 'oncall@hotel.com', '', True),
+            ('whatsapp_channel_and_phone', 'WHATSAPP', '', '+919999999999', True),
+            # EMAIL_WHATSAPP with only email set — still enabled
+            ('both_channel_only_email', 'EMAIL_WHATSAPP', 'oncall@hotel.com', '', True),
+        ]
+        for name, channel, email, phone, expected in cases:
+            with self.subTest(case=name):
+                self.hotel.escalation_fallback_channel = channel
+                self.hotel.oncall_email = email
+                self.hotel.oncall_phone = phone
+                self.assertEqual(bool(self.adapter.is_enabled(self.hotel)), expected)
 
 
 @override_settings(GUPSHUP_WA_API_KEY='test-key')
 class OncallAdapterRecipientsTest(NotificationSetupMixin, TestCase):
     """get_recipients() only fires for escalation events."""
 
-    def setUp(self):
-        self.adapter = OncallAdapter()
-        self.hotel.escalation_fallback_channel = 'EMAIL_WHATSAPP'
-        self.hotel.oncall_email = 'oncall@hotel.com'
-        self.hotel.oncall_phone = '+919999999999'
-        self.hotel.save(update_fields=[
-            'escalation_fallback_channel', 'oncall_email', 'oncall_phone',
+    adapter = OncallAdapter()
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.hotel.escalation_fallback_channel = 'EMAIL_WHATSAPP'
+        cls.hotel.oncall_email = 'oncall@hotel.com'
+        cls.hotel.oncall_phone = '+919999999999'
+        Hotel.objects.filter(pk=cls.hotel.pk).update(
+            escalation_fallback_channel='EMAIL_WHATSAPP',
+            oncall_email='oncall@hotel.com',
+            oncall_phone='+919999999999',
+        )
+
+    def _seed_delivery(self, req, specs):
+        """Insert route-adapter DeliveryRecords for ``req`` in one query."""
+        DeliveryRecord.objects.bulk_create([
+            DeliveryRecord(
+                hotel=self.hotel, request=req, event_type="escalation",
+                status=DeliveryRecord.Status.QUEUED, message_type="TEMPLATE",
+                **spec,
+            )
+            for spec in specs
         ])
 
     def test_returns_empty_for_request_created(self):
@@ -2113,14 +2068,16 @@ class OncallAdapterRecipientsTest(NotificationSetupMixin, TestCase):
 
     def test_returns_both_targets_for_escalation(self):
         event = self._make_event(event_type='escalation', escalation_tier=1)
-        recipients = self.adapter.get_recipients(event)
+        # Both targets are checked against route records in one query
+        with self.assertNumQueries(1):
+            recipients = self.adapter.get_recipients(event)
         self.assertEqual(len(recipients), 2)
         channels = {r.channel for r in recipients}
         self.assertEqual(channels, {'EMAIL', 'WHATSAPP'})
 
     def test_email_only_channel(self):
         self.hotel.escalation_fallback_channel = 'EMAIL'
-        self.hotel.save(update_fields=['escalation_fallback_channel'])
+        Hotel.objects.filter(pk=self.hotel.pk).update(escalation_fallback_channel='EMAIL')
         event = self._make_event(event_type='escalation', escalation_tier=1)
         recipients = self.adapter.get_recipients(event)
         self.assertEqual(len(recipients), 1)
@@ -2129,7 +2086,7 @@ class OncallAdapterRecipientsTest(NotificationSetupMixin, TestCase):
 
     def test_whatsapp_only_channel(self):
         self.hotel.escalation_fallback_channel = 'WHATSAPP'
-        self.hotel.save(update_fields=['escalation_fallback_channel'])
+        Hotel.objects.filter(pk=self.hotel.pk).update(escalation_fallback_channel='WHATSAPP')
         event = self._make_event(event_type='escalation', escalation_tier=1)
         recipients = self.adapter.get_recipients(event)
         self.assertEqual(len(recipients), 1)
@@ -2149,7 +2106,7 @@ class OncallAdapterRecipientsTest(NotificationSetupMixin, TestCase):
     def test_email_whatsapp_with_only_phone(self):
         """EMAIL_WHATSAPP with no email → only WhatsApp target."""
         self.hotel.oncall_email = ''
-        self.hotel.save(update_fields=['oncall_email'])
+        Hotel.objects.filter(pk=self.hotel.pk).update(oncall_email='')
         event = self._make_event(event_type='escalation', escalation_tier=1)
         recipients = self.adapter.get_recipients(event)
         self.assertEqual(len(recipients), 1)
@@ -2157,18 +2114,12 @@ class OncallAdapterRecipientsTest(NotificationSetupMixin, TestCase):
 
     def test_skips_target_already_covered_by_route_adapter(self):
         """On-call email matches an existing route DeliveryRecord → deduplicated."""
-        req = self._make_request()
+        req = self.default_request
         # Simulate a route-based EmailAdapter having already created a record
-        DeliveryRecord.objects.create(
-            idempotency_key=f"email:escalation:{req.public_id}:1:99",
-            hotel=self.hotel,
-            request=req,
-            channel="EMAIL",
-            target="oncall@hotel.com",
-            event_type="escalation",
-            status=DeliveryRecord.Status.QUEUED,
-            message_type="TEMPLATE",
-        )
+        self._seed_delivery(req, [{
+            'idempotency_key': f"email:escalation:{req.public_id}:1:99",
+            'channel': "EMAIL", 'target': "oncall@hotel.com",
+        }])
         event = self._make_event(request=req, event_type='escalation', escalation_tier=1)
         recipients = self.adapter.get_recipients(event)
         # Email target should be filtered out; WhatsApp should remain
@@ -2178,18 +2129,12 @@ class OncallAdapterRecipientsTest(NotificationSetupMixin, TestCase):
 
     def test_skips_whatsapp_target_already_covered_by_route(self):
         """On-call phone matches an existing route DeliveryRecord → deduplicated."""
-        req = self._make_request()
+        req = self.default_request
         # Route targets are digits-only (NotificationRoute.save() strips non-digits)
-        DeliveryRecord.objects.create(
-            idempotency_key=f"wa:escalation:{req.public_id}:2:42",
-            hotel=self.hotel,
-            request=req,
-            channel="WHATSAPP",
-            target="919999999999",
-            event_type="escalation",
-            status=DeliveryRecord.Status.QUEUED,
-            message_type="TEMPLATE",
-        )
+        self._seed_delivery(req, [{
+            'idempotency_key': f"wa:escalation:{req.public_id}:2:42",
+            'channel': "WHATSAPP", 'target': "919999999999",
+        }])
         event = self._make_event(request=req, event_type='escalation', escalation_tier=2)
         recipients = self.adapter.get_recipients(event)
         channels = {r.channel for r in recipients}
@@ -2198,17 +2143,11 @@ class OncallAdapterRecipientsTest(NotificationSetupMixin, TestCase):
 
     def test_different_tier_not_deduplicated(self):
         """Route record at tier 1 does NOT suppress on-call at tier 2."""
-        req = self._make_request()
-        DeliveryRecord.objects.create(
-            idempotency_key=f"email:escalation:{req.public_id}:1:99",
-            hotel=self.hotel,
-            request=req,
-            channel="EMAIL",
-            target="oncall@hotel.com",
-            event_type="escalation",
-            status=DeliveryRecord.Status.QUEUED,
-            message_type="TEMPLATE",
-        )
+        req = self.default_request
+        self._seed_delivery(req, [{
+            'idempotency_key': f"email:escalation:{req.public_id}:1:99",
+            'channel': "EMAIL", 'target': "oncall@hotel.com",
+        }])
         event = self._make_event(request=req, event_type='escalation', escalation_tier=2)
         recipients = self.adapter.get_recipients(event)
         # Tier 2 should NOT be suppressed by a tier 1 record
@@ -2218,33 +2157,29 @@ class OncallAdapterRecipientsTest(NotificationSetupMixin, TestCase):
 
     def test_both_targets_covered_returns_empty(self):
         """Both on-call targets already covered by routes → empty list."""
-        req = self._make_request()
-        DeliveryRecord.objects.create(
-            idempotency_key=f"email:escalation:{req.public_id}:1:99",
-            hotel=self.hotel, request=req, channel="EMAIL",
-            target="oncall@hotel.com", event_type="escalation",
-            status=DeliveryRecord.Status.QUEUED, message_type="TEMPLATE",
-        )
-        DeliveryRecord.objects.create(
-            idempotency_key=f"wa:escalation:{req.public_id}:1:42",
-            hotel=self.hotel, request=req, channel="WHATSAPP",
-            target="919999999999", event_type="escalation",
-            status=DeliveryRecord.Status.QUEUED, message_type="TEMPLATE",
-        )
+        req = self.default_request
+        self._seed_delivery(req, [
+            {
+                'idempotency_key': f"email:escalation:{req.public_id}:1:99",
+                'channel': "EMAIL", 'target': "oncall@hotel.com",
+            },
+            {
+                'idempotency_key': f"wa:escalation:{req.public_id}:1:42",
+                'channel': "WHATSAPP", 'target': "919999999999",
+            },
+        ])
         event = self._make_event(request=req, event_type='escalation', escalation_tier=1)
         recipients = self.adapter.get_recipients(event)
         self.assertEqual(recipients, [])
 
     def test_phone_normalization_enables_dedupe(self):
         """hotel.oncall_phone='+919...' matches route target='919...' after normalization."""
-        req = self._make_request()
+        req = self.default_request
         # Route adapter stores digits-only (NotificationRoute.save() strips non-digits)
-        DeliveryRecord.objects.create(
-            idempotency_key=f"wa:escalation:{req.public_id}:1:42",
-            hotel=self.hotel, request=req, channel="WHATSAPP",
-            target="919999999999", event_type="escalation",
-            status=DeliveryRecord.Status.QUEUED, message_type="TEMPLATE",
-        )
+        self._seed_delivery(req, [{
+            'idempotency_key': f"wa:escalation:{req.public_id}:1:42",
+            'channel': "WHATSAPP", 'target': "919999999999",
+        }])
         # Hotel field stores +91... (CharField, no auto-normalization)
         self.assertEqual(self.hotel.oncall_phone, '+919999999999')
         event = self._make_event(request=req, event_type='escalation', escalation_tier=1)
@@ -2258,22 +2193,28 @@ class OncallAdapterRecipientsTest(NotificationSetupMixin, TestCase):
 class OncallAdapterSendTest(NotificationSetupMixin, TestCase):
     """send() creates DeliveryRecord and dispatches Celery task."""
 
-    def setUp(self):
-        self.adapter = OncallAdapter()
-        self.hotel.escalation_fallback_channel = 'EMAIL_WHATSAPP'
-        self.hotel.oncall_email = 'oncall@hotel.com'
-        self.hotel.oncall_phone = '+919999999999'
-        self.hotel.save(update_fields=[
-            'escalation_fallback_channel', 'oncall_email', 'oncall_phone',
-        ])
+    adapter = OncallAdapter()
 
-    @patch('concierge.notifications.tasks.send_email_notification.delay')
-    def test_email_send_creates_delivery_record(self, mock_delay):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.hotel.escalation_fallback_channel = 'EMAIL_WHATSAPP'
+        cls.hotel.oncall_email = 'oncall@hotel.com'
+        cls.hotel.oncall_phone = '+919999999999'
+        Hotel.objects.filter(pk=cls.hotel.pk).update(
+            escalation_fallback_channel='EMAIL_WHATSAPP',
+            oncall_email='oncall@hotel.com',
+            oncall_phone='+919999999999',
+        )
+
+    def test_email_send_creates_delivery_record(self):
+        mock_delay = _DELAY_MOCKS['send_email_notification']
         req = self._make_request()
         event = self._make_event(request=req, event_type='escalation', escalation_tier=2)
         target = OncallTarget(channel='EMAIL', target='oncall@hotel.com')
 
-        record = self.adapter.send(target, event)
+        with self.captureOnCommitCallbacks(execute=True):
+            record = self.adapter.send(target, event)
 
         self.assertIsInstance(record, DeliveryRecord)
         self.assertIsNone(record.route)
@@ -2285,13 +2226,14 @@ class OncallAdapterSendTest(NotificationSetupMixin, TestCase):
         self.assertIn(':2', record.idempotency_key)
         mock_delay.assert_called_once()
 
-    @patch('concierge.notifications.tasks.send_whatsapp_template_notification.delay')
-    def test_whatsapp_send_template_no_window(self, mock_delay):
+    def test_whatsapp_send_template_no_window(self):
+        mock_delay = _DELAY_MOCKS['send_whatsapp_template_notification']
         req = self._make_request()
         event = self._make_event(request=req, event_type='escalation', escalation_tier=1)
         target = OncallTarget(channel='WHATSAPP', target='919999999999')
 
-        record = self.adapter.send(target, event)
+        with self.captureOnCommitCallbacks(execute=True):
+            record = self.adapter.send(target, event)
 
         self.assertIsInstance(record, DeliveryRecord)
         self.assertIsNone(record.route)
@@ -2299,8 +2241,8 @@ class OncallAdapterSendTest(NotificationSetupMixin, TestCase):
         self.assertEqual(record.message_type, 'TEMPLATE')
         mock_delay.assert_called_once()
 
-    @patch('concierge.notifications.tasks.send_whatsapp_session_notification.delay')
-    def test_whatsapp_send_session_with_active_window(self, mock_delay):
+    def test_whatsapp_send_session_with_active_window(self):
+        mock_delay = _DELAY_MOCKS['send_whatsapp_session_notification']
         WhatsAppServiceWindow.objects.create(
             hotel=self.hotel, phone='919999999999',
             last_inbound_at=timezone.now(),
@@ -2309,44 +2251,75 @@ class OncallAdapterSendTest(NotificationSetupMixin, TestCase):
         event = self._make_event(request=req, event_type='escalation', escalation_tier=1)
         target = OncallTarget(channel='WHATSAPP', target='919999999999')
 
-        record = self.adapter.send(target, event)
+        with self.captureOnCommitCallbacks(execute=True):
+            record = self.adapter.send(target, event)
 
         self.assertEqual(record.message_type, 'SESSION')
         mock_delay.assert_called_once()
 
-    @patch('concierge.notifications.tasks.send_email_notification.delay')
-    def test_idempotency_prevents_duplicate(self, mock_delay):
+    def test_idempotency_prevents_duplicate(self):
+        mock_delay = _DELAY_MOCKS['send_email_notification']
         req = self._make_request()
         event = self._make_event(request=req, event_type='escalation', escalation_tier=1)
         target = OncallTarget(channel='EMAIL', target='oncall@hotel.com')
 
-        record1 = self.adapter.send(target, event)
-        record2 = self.adapter.send(target, event)
+        with self.captureOnCommitCallbacks(execute=True):
+            record1 = self.adapter.send(target, event)
+            record2 = self.adapter.send(target, event)
 
         self.assertEqual(record1.id, record2.id)
         mock_delay.assert_called_once()  # Only dispatched once
 
-    @patch('concierge.notifications.tasks.send_email_notification.delay')
-    def test_different_tiers_create_separate_records(self, mock_delay):
+    def test_different_tiers_create_separate_records(self):
+        mock_delay = _DELAY_MOCKS['send_email_notification']
         req = self._make_request()
         target = OncallTarget(channel='EMAIL', target='oncall@hotel.com')
 
         event1 = self._make_event(request=req, event_type='escalation', escalation_tier=1)
-        record1 = self.adapter.send(target, event1)
+        with self.captureOnCommitCallbacks(execute=True):
+            record1 = self.adapter.send(target, event1)
 
         event2 = self._make_event(request=req, event_type='escalation', escalation_tier=2)
-        record2 = self.adapter.send(target, event2)
+        with self.captureOnCommitCallbacks(execute=True):
+            record2 = self.adapter.send(target, event2)
 
         self.assertNotEqual(record1.id, record2.id)
         self.assertEqual(mock_delay.call_count, 2)
 
-    @patch('concierge.notifications.tasks.send_email_notification.delay')
-    def test_params_include_escalation_tier(self, mock_delay):
+    def test_send_many_queues_each_target_once(self):
+        """Batch send routes each channel to its task and skips existing keys."""
+        email_delay = _DELAY_MOCKS['send_email_notification']
+        session_delay = _DELAY_MOCKS['send_whatsapp_session_notification']
+        WhatsAppServiceWindow.objects.create(
+            hotel=self.hotel, phone='919999999999',
+            last_inbound_at=timezone.now(),
+        )
+        event = self._make_event(event_type='escalation', escalation_tier=1)
+        targets = [
+            OncallTarget(channel='EMAIL', target='oncall@hotel.com'),
+            OncallTarget(channel='WHATSAPP', target='919999999999'),
+        ]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.adapter.send_many(targets, event)
+            self.adapter.send_many(targets, event)  # No-op: keys exist
+
+        records = DeliveryRecord.objects.filter(request=event.request, route__isnull=True)
+        self.assertEqual(
+            dict(records.values_list('channel', 'message_type')),
+            {'EMAIL': 'TEMPLATE', 'WHATSAPP': 'SESSION'},
+        )
+        email_delay.assert_called_once()
+        session_delay.assert_called_once()
+
+    def test_params_include_escalation_tier(self):
+        mock_delay = _DELAY_MOCKS['send_email_notification']
         req = self._make_request()
         event = self._make_event(request=req, event_type='escalation', escalation_tier=3)
         target = OncallTarget(channel='EMAIL', target='oncall@hotel.com')
 
-        self.adapter.send(target, event)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.adapter.send(target, event)
 
         params = mock_delay.call_args[0][1]
         self.assertEqual(params['escalation_tier'], 3)
@@ -2358,14 +2331,16 @@ class OncallAdapterSendTest(NotificationSetupMixin, TestCase):
 class OncallDispatchIntegrationTest(NotificationSetupMixin, TestCase):
     """End-to-end: dispatch_notification routes escalation to OncallAdapter."""
 
-    def setUp(self):
-        self.hotel.escalation_fallback_channel = 'EMAIL'
-        self.hotel.oncall_email = 'oncall@hotel.com'
-        self.hotel.save(update_fields=['escalation_fallback_channel', 'oncall_email'])
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.hotel.escalation_fallback_channel = 'EMAIL'
+        cls.hotel.oncall_email = 'oncall@hotel.com'
+        Hotel.objects.filter(pk=cls.hotel.pk).update(
+            escalation_fallback_channel='EMAIL', oncall_email='oncall@hotel.com',
+        )
 
-    @patch('concierge.notifications.tasks.send_email_notification.delay')
-    @patch('concierge.notifications.tasks.send_push_notification_task.delay')
-    def test_escalation_dispatches_to_oncall(self, mock_push, mock_email):
+    def test_escalation_dispatches_to_oncall(self):
         req = self._make_request()
         event = self._make_event(request=req, event_type='escalation', escalation_tier=1)
 
@@ -2381,9 +2356,7 @@ class OncallDispatchIntegrationTest(NotificationSetupMixin, TestCase):
         self.assertEqual(record.channel, 'EMAIL')
         self.assertIsNone(record.route)
 
-    @patch('concierge.notifications.tasks.send_email_notification.delay')
-    @patch('concierge.notifications.tasks.send_push_notification_task.delay')
-    def test_request_created_does_not_dispatch_to_oncall(self, mock_push, mock_email):
+    def test_request_created_does_not_dispatch_to_oncall(self):
         req = self._make_request()
         event = self._make_event(request=req, event_type='request.created')
 
@@ -2394,11 +2367,9 @@ class OncallDispatchIntegrationTest(NotificationSetupMixin, TestCase):
         )
         self.assertEqual(oncall_records.count(), 0)
 
-    @patch('concierge.notifications.tasks.send_email_notification.delay')
-    @patch('concierge.notifications.tasks.send_push_notification_task.delay')
-    def test_oncall_disabled_does_not_dispatch(self, mock_push, mock_email):
+    def test_oncall_disabled_does_not_dispatch(self):
         self.hotel.escalation_fallback_channel = 'NONE'
-        self.hotel.save(update_fields=['escalation_fallback_channel'])
+        Hotel.objects.filter(pk=self.hotel.pk).update(escalation_fallback_channel='NONE')
 
         req = self._make_request()
         event = self._make_event(request=req, event_type='escalation', escalation_tier=1)
@@ -2418,14 +2389,13 @@ class OncallDispatchIntegrationTest(NotificationSetupMixin, TestCase):
 class GuestStatusUpdateTest(NotificationSetupMixin, TestCase):
     """Tests for WhatsApp guest notification on request status change."""
 
-    @patch('concierge.notifications.tasks.send_request_status_whatsapp_task.delay')
-    def test_confirmed_sends_whatsapp(self, mock_delay):
+    def test_confirmed_sends_whatsapp(self):
         """Confirming a request queues a WhatsApp status update."""
+        mock_delay = _DELAY_MOCKS['send_request_status_whatsapp_task']
         self.guest_user.phone = '919000000001'
         self.guest_user.save(update_fields=['phone'])
 
         req = self._make_request(experience=self.experience)
-        from concierge.services import send_guest_status_update
         send_guest_status_update(req, 'CONFIRMED')
 
         record = DeliveryRecord.objects.get(
@@ -2441,14 +2411,13 @@ class GuestStatusUpdateTest(NotificationSetupMixin, TestCase):
             'status_label': 'confirmed',
         })
 
-    @patch('concierge.notifications.tasks.send_request_status_whatsapp_task.delay')
-    def test_not_available_sends_whatsapp(self, mock_delay):
+    def test_not_available_sends_whatsapp(self):
         """NOT_AVAILABLE status queues with correct label."""
+        mock_delay = _DELAY_MOCKS['send_request_status_whatsapp_task']
         self.guest_user.phone = '919000000001'
         self.guest_user.save(update_fields=['phone'])
 
         req = self._make_request(experience=self.experience)
-        from concierge.services import send_guest_status_update
         send_guest_status_update(req, 'NOT_AVAILABLE')
 
         record = DeliveryRecord.objects.get(
@@ -2458,14 +2427,13 @@ class GuestStatusUpdateTest(NotificationSetupMixin, TestCase):
         ctx = mock_delay.call_args[0][1]
         self.assertEqual(ctx['status_label'], 'not available at this time')
 
-    @patch('concierge.notifications.tasks.send_request_status_whatsapp_task.delay')
-    def test_no_phone_skips_silently(self, mock_delay):
+    def test_no_phone_skips_silently(self):
         """Guest without phone → no DeliveryRecord created."""
+        mock_delay = _DELAY_MOCKS['send_request_status_whatsapp_task']
         self.guest_user.phone = ''
         self.guest_user.save(update_fields=['phone'])
 
         req = self._make_request(experience=self.experience)
-        from concierge.services import send_guest_status_update
         send_guest_status_update(req, 'CONFIRMED')
 
         self.assertFalse(
@@ -2475,14 +2443,13 @@ class GuestStatusUpdateTest(NotificationSetupMixin, TestCase):
         )
         mock_delay.assert_not_called()
 
-    @patch('concierge.notifications.tasks.send_request_status_whatsapp_task.delay')
-    def test_idempotent_no_duplicate(self, mock_delay):
+    def test_idempotent_no_duplicate(self):
         """Calling send_guest_status_update twice creates only one record."""
+        mock_delay = _DELAY_MOCKS['send_request_status_whatsapp_task']
         self.guest_user.phone = '919000000001'
         self.guest_user.save(update_fields=['phone'])
 
         req = self._make_request(experience=self.experience)
-        from concierge.services import send_guest_status_update
         send_guest_status_update(req, 'CONFIRMED')
         send_guest_status_update(req, 'CONFIRMED')
 
@@ -2498,7 +2465,6 @@ class GuestStatusUpdateTest(NotificationSetupMixin, TestCase):
     def test_view_details_postback(self, mock_send):
         """g_req_view postback sends guest request URL."""
         req = self._make_request(experience=self.experience)
-        from concierge.notifications.webhook import _handle_request_view_postback
         _handle_request_view_postback(f'g_req_view:{req.public_id}', '919876543210')
 
         mock_send.assert_called_once()